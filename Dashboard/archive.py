@@ -0,0 +1,224 @@
+"""
+Columnar archive for sensor and summary history.
+
+Tables are stored as Parquet files partitioned by site and day:
+
+    <root>/<dataset>/site=<site>/day=YYYY-MM-DD/part-0.parquet
+
+Columns are typed (timestamps, floats) and label columns are dictionary-encoded.
+Reads prune partitions by directory name before opening any file, then push the
+column selection and timestamp filter down into Parquet, memory-mapping each file.
+
+Usage:
+    python archive.py import-sensors ../dataset/Plant_1_Weather_Sensor_Data.csv
+    python archive.py import-history history.csv
+    python archive.py query history --start 2026-01-20 --end 2026-01-22
+"""
+import argparse
+import datetime
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+BASE_DIR = os.path.dirname(__file__)
+ARCHIVE_DIR = os.path.join(BASE_DIR, "..", "archive")
+
+DEFAULT_SITE = "plant_1"
+
+# Dataset PLANT_ID -> site id, matching SITES in EdgeAI/inference/forecast_engine.py
+PLANT_SITES = {
+    "4135001": "plant_1",
+}
+PART_FILE = "part-0.parquet"
+
+# Typed schemas per dataset; dictionary columns hold repeated labels
+SCHEMAS = {
+    "sensors": pa.schema([
+        ("timestamp", pa.timestamp("ms")),
+        ("site", pa.dictionary(pa.int32(), pa.string())),
+        ("source_key", pa.dictionary(pa.int32(), pa.string())),
+        ("ambient_temperature", pa.float64()),
+        ("module_temperature", pa.float64()),
+        ("irradiation", pa.float64()),
+    ]),
+    "history": pa.schema([
+        ("timestamp", pa.timestamp("us")),
+        ("site", pa.dictionary(pa.int32(), pa.string())),
+        ("expected_power", pa.float64()),
+        ("actual_power", pa.float64()),
+        ("avg_loss_percent", pa.float64()),
+        ("health_score", pa.float64()),
+        ("vision_label", pa.dictionary(pa.int32(), pa.string())),
+        ("problem", pa.dictionary(pa.int32(), pa.string())),
+    ]),
+}
+
+def _dictionary_columns(dataset):
+    return [f.name for f in SCHEMAS[dataset] if pa.types.is_dictionary(f.type)]
+
+def _to_day(value):
+    if value is None:
+        return None
+    return pd.Timestamp(value).date()
+
+def _is_date_only(value):
+    """True for a bare date (date object or "YYYY-MM-DD"), which means the whole day."""
+    if isinstance(value, str):
+        return len(value.strip()) == 10
+    return isinstance(value, datetime.date) and not isinstance(value, datetime.datetime)
+
+def write_frame(df, dataset, root=ARCHIVE_DIR):
+    """
+    Write a DataFrame (columns as in SCHEMAS[dataset]) into the archive.
+    Rows are merged into existing day partitions; exact duplicates are dropped,
+    so importing the same source twice is harmless. Returns the number of files written.
+    """
+    schema = SCHEMAS[dataset]
+    df = df.dropna(subset=["timestamp"])
+    written = 0
+
+    for (site, day), part in df.groupby([df["site"], df["timestamp"].dt.date], sort=True):
+        directory = os.path.join(root, dataset, f"site={site}", f"day={day.isoformat()}")
+        path = os.path.join(directory, PART_FILE)
+
+        if os.path.exists(path):
+            existing = pq.read_table(path).to_pandas()
+            part = pd.concat([existing, part], ignore_index=True)
+        part = part.astype({c: str for c in _dictionary_columns(dataset)})
+        part = part.drop_duplicates().sort_values("timestamp")
+
+        table = pa.Table.from_pandas(part[schema.names], schema=schema, preserve_index=False)
+        os.makedirs(directory, exist_ok=True)
+        pq.write_table(table, path, compression="zstd")
+        written += 1
+
+    return written
+
+def partition_files(dataset, root=ARCHIVE_DIR, start=None, end=None, sites=None):
+    """Parquet files for the requested sites and days, pruned by directory name only."""
+    start_day, end_day = _to_day(start), _to_day(end)
+    dataset_dir = os.path.join(root, dataset)
+    if not os.path.isdir(dataset_dir):
+        return []
+
+    files = []
+    for site_dir in sorted(os.listdir(dataset_dir)):
+        if not site_dir.startswith("site="):
+            continue
+        if sites is not None and site_dir[len("site="):] not in sites:
+            continue
+        for day_dir in sorted(os.listdir(os.path.join(dataset_dir, site_dir))):
+            if not day_dir.startswith("day="):
+                continue
+            day = datetime.date.fromisoformat(day_dir[len("day="):])
+            if (start_day and day < start_day) or (end_day and day > end_day):
+                continue
+            path = os.path.join(dataset_dir, site_dir, day_dir, PART_FILE)
+            if os.path.exists(path):
+                files.append(path)
+    return files
+
+def read_range(dataset, root=ARCHIVE_DIR, start=None, end=None, columns=None, sites=None):
+    """
+    Read rows with start <= timestamp <= end as a pyarrow Table
+    (a date-only end covers the whole day).
+    Only the partitions overlapping the range are opened, only the requested
+    columns are decoded, and files are memory-mapped.
+    """
+    schema = SCHEMAS[dataset]
+    if columns is not None and "timestamp" not in columns:
+        columns = ["timestamp"] + list(columns)
+
+    filters = []
+    if start is not None:
+        filters.append(("timestamp", ">=", pd.Timestamp(start).to_pydatetime()))
+    if end is not None and _is_date_only(end):
+        # A bare end date includes that whole day, same as partition_files
+        filters.append(("timestamp", "<", (pd.Timestamp(end) + pd.Timedelta(days=1)).to_pydatetime()))
+    elif end is not None:
+        filters.append(("timestamp", "<=", pd.Timestamp(end).to_pydatetime()))
+
+    dictionary_columns = _dictionary_columns(dataset)
+    tables = [
+        pq.read_table(
+            path,
+            columns=columns,
+            filters=filters or None,
+            memory_map=True,
+            read_dictionary=[c for c in dictionary_columns if columns is None or c in columns],
+        )
+        for path in partition_files(dataset, root, start, end, sites)
+    ]
+
+    if not tables:
+        names = columns or schema.names
+        return pa.table({name: pa.array([], type=schema.field(name).type) for name in names})
+    return pa.concat_tables(tables)
+
+# ------------------------
+# IMPORTERS
+# ------------------------
+def import_sensor_csv(csv_path, root=ARCHIVE_DIR):
+    """Import dataset/Plant_*_Weather_Sensor_Data.csv (one site per PLANT_ID, see PLANT_SITES)."""
+    raw = pd.read_csv(csv_path, dtype={"PLANT_ID": str, "SOURCE_KEY": str})
+    df = pd.DataFrame({
+        "timestamp": pd.to_datetime(raw["DATE_TIME"], format="%Y-%m-%d %H:%M:%S"),
+        "site": raw["PLANT_ID"].map(lambda plant_id: PLANT_SITES.get(plant_id, plant_id)),
+        "source_key": raw["SOURCE_KEY"],
+        "ambient_temperature": raw["AMBIENT_TEMPERATURE"].astype(float),
+        "module_temperature": raw["MODULE_TEMPERATURE"].astype(float),
+        "irradiation": raw["IRRADIATION"].astype(float),
+    })
+    return write_frame(df, "sensors", root)
+
+def import_history_csv(csv_path, root=ARCHIVE_DIR, site=DEFAULT_SITE):
+    """Import Dashboard/history.csv (mixed timestamp formats, one site)."""
+    raw = pd.read_csv(csv_path)
+    df = pd.DataFrame({
+        "timestamp": pd.to_datetime(raw["time"], format="mixed"),
+        "site": site,
+        "expected_power": pd.to_numeric(raw["expected_power"], errors="coerce"),
+        "actual_power": pd.to_numeric(raw["actual_power"], errors="coerce"),
+        "avg_loss_percent": pd.to_numeric(raw["avg_loss_percent"], errors="coerce"),
+        "health_score": pd.to_numeric(raw["health_score"], errors="coerce"),
+        "vision_label": raw["vision_label"].fillna("Unknown"),
+        "problem": raw["problem"].fillna("None"),
+    })
+    return write_frame(df, "history", root)
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar Parquet archive for sensor and summary history")
+    parser.add_argument("--root", default=ARCHIVE_DIR, help="Archive root directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sensors = commands.add_parser("import-sensors", help="Import a weather sensor CSV")
+    sensors.add_argument("csv")
+
+    history = commands.add_parser("import-history", help="Import the dashboard history CSV")
+    history.add_argument("csv")
+    history.add_argument("--site", default=DEFAULT_SITE)
+
+    query = commands.add_parser("query", help="Print rows for a date range")
+    query.add_argument("dataset", choices=sorted(SCHEMAS))
+    query.add_argument("--start")
+    query.add_argument("--end")
+    query.add_argument("--columns", help="Comma-separated column names")
+    query.add_argument("--site", action="append", dest="sites")
+
+    args = parser.parse_args()
+
+    if args.command == "import-sensors":
+        print(f"Wrote {import_sensor_csv(args.csv, args.root)} day partitions")
+    elif args.command == "import-history":
+        print(f"Wrote {import_history_csv(args.csv, args.root, args.site)} day partitions")
+    else:
+        columns = args.columns.split(",") if args.columns else None
+        files = partition_files(args.dataset, args.root, args.start, args.end, args.sites)
+        table = read_range(args.dataset, args.root, args.start, args.end, columns, args.sites)
+        print(table.to_pandas().to_string(max_rows=20))
+        print(f"{table.num_rows} rows from {len(files)} files")
+
+if __name__ == "__main__":
+    main()
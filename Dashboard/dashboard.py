@@ -4,6 +4,10 @@ import pandas as pd
 import datetime
 import time
 import os
+import base64
+import functools
+
+from history_store import HistoryStore
 
 API_URL = "http://127.0.0.1:5000/api/summary"
 WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
@@ -11,6 +15,8 @@ WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
 LAT = 12.9184
 LON = 79.1325
 REFRESH_SECONDS = 10
+WEATHER_TTL_SECONDS = 600
+CHART_POINTS = 500  # Point budget per trend chart, whatever the date range
 
 HISTORY_FILE = "history.csv"
 
@@ -49,6 +55,9 @@ h3 { font-size: 14px; margin: 8px 0 3px 0; }
 # ------------------------
 # DATA FUNCTIONS
 # ------------------------
+# Loaders are TTL-cached so widget interactions and fragment reruns reuse the
+# last response instead of hitting the API / open-meteo again.
+@st.cache_data(ttl=REFRESH_SECONDS, show_spinner=False)
 def fetch_solar_data():
     try:
         res = requests.get(API_URL, timeout=5)
@@ -56,6 +65,7 @@ def fetch_solar_data():
     except:
         return None
 
+@st.cache_data(ttl=WEATHER_TTL_SECONDS, show_spinner=False)
 def fetch_weather():
     try:
         params = {
@@ -71,6 +81,15 @@ def fetch_weather():
     except:
         return None
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def decode_panel_image(encoded):
+    """Decode the base64 panel image once per distinct image."""
+    return base64.b64decode(encoded)
+
+def current_solar():
+    """Latest edge summary from the cache; empty if the API went away since the page loaded."""
+    return fetch_solar_data() or {}
+
 def calculate_weather_summary(weather_json):
     rain = weather_json["hourly"]["precipitation"]
     clouds = weather_json["hourly"]["cloudcover"]
@@ -113,26 +132,49 @@ def system_decision(dust_detected, vision_label, avg_loss_percent, rain_expected
 # ------------------------
 # HISTORY TRACKING
 # ------------------------
-def load_history():
-    """Load history from CSV file. Return empty DataFrame if file doesn't exist."""
+def history_mtime():
+    """Modification time of the history file, used as the history cache key."""
     if os.path.exists(HISTORY_FILE):
-        return pd.read_csv(HISTORY_FILE)
-    return pd.DataFrame()
+        return os.path.getmtime(HISTORY_FILE)
+    return None
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _load_history(mtime):
+    df = pd.read_csv(HISTORY_FILE)
+    # Parse mixed timestamp formats once instead of in every chart
+    df["time"] = pd.to_datetime(df["time"], format="mixed", utc=False)
+    return df
+
+def load_history():
+    """
+    Load history from CSV file. Return empty DataFrame if file doesn't exist.
+    The parsed frame is cached until the file changes and must be treated as read-only.
+    """
+    mtime = history_mtime()
+    if mtime is None:
+        return pd.DataFrame()
+    return _load_history(mtime)
 
 def save_history(row):
     """Save history row only if it's not a duplicate."""
+    # The same summary is seen on every rerun until the edge posts a new one
+    row_key = (row["time"], row["expected_power"], row.get("problem"))
+    if st.session_state.get("last_history_key") == row_key:
+        return
+    st.session_state["last_history_key"] = row_key
+
     df = pd.DataFrame([row])
     
     if not os.path.exists(HISTORY_FILE):
         df.to_csv(HISTORY_FILE, index=False)
         return
     
-    # Load existing data
-    existing_df = pd.read_csv(HISTORY_FILE)
+    # Check against the cached history instead of re-reading the file
+    existing_df = load_history()
     
     # Check for duplicate (same time, expected_power, and problem)
     if len(existing_df) > 0:
-        time_match = existing_df['time'] == row['time']
+        time_match = existing_df['time'] == pd.to_datetime(row['time'], format="mixed")
         power_match = existing_df['expected_power'] == row['expected_power']
         
         # Check problem column if it exists
@@ -149,6 +191,72 @@ def save_history(row):
     # No duplicate, append
     df.to_csv(HISTORY_FILE, mode="a", header=False, index=False)
 
+def build_history_row(solar):
+    """Turn the latest edge summary into a history row."""
+    # Safely choose a time key from the solar summary. If missing, use current time.
+    if "date" in solar:
+        time_key = "date"
+    elif "timestamp" in solar:
+        time_key = "timestamp"
+    else:
+        time_key = None
+
+    if time_key and time_key in solar:
+        time_value = solar[time_key]
+    else:
+        # Fall back to standard datetime format
+        time_value = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # Determine problem based on system status
+    problem = "None"
+    if solar.get("dust_detected"):
+        problem = "Dust Detected"
+    elif solar.get("vision_label") == "BirdDroppings":
+        problem = "Bird Droppings"
+    elif solar.get("vision_label") == "ElectricalDamage":
+        problem = "Electrical Damage"
+    elif solar.get("avg_loss_percent", 0) > 20:
+        problem = f"High Loss ({solar.get('avg_loss_percent')}%)"
+
+    return {
+        "time": time_value,
+        "expected_power": solar.get("expected_power"),
+        "actual_power": solar.get("expected_power", 0) * (1 - solar.get("avg_loss_percent", 0) / 100),
+        "avg_loss_percent": solar.get("avg_loss_percent"),
+        "health_score": solar.get("health_score"),
+        "vision_label": solar.get("vision_label"),
+        "problem": problem
+    }
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_history_store(mtime):
+    """Multi-resolution history for the trend charts, rebuilt only when the history file changes."""
+    if mtime is None:
+        return None
+    return HistoryStore(load_history())
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def daily_summary_table(mtime):
+    """Daily totals per date, recomputed only when the history file changes."""
+    if mtime is None:
+        return pd.DataFrame()
+    daily_df = load_history().dropna(subset=["expected_power", "actual_power"])
+    if len(daily_df) == 0:
+        return pd.DataFrame()
+
+    # Group by date and calculate daily totals
+    daily_summary = daily_df.groupby(daily_df["time"].dt.date).agg({
+        "expected_power": "sum",
+        "actual_power": "sum",
+        "health_score": "mean"
+    }).round(2)
+
+    # Rename columns for display
+    daily_summary.columns = ["Total Expected Power", "Total Actual Power", "Avg Health Score"]
+    daily_summary.index = daily_summary.index.astype(str)
+    daily_summary.index.name = "Date"
+    return daily_summary
+
 def send_cleaning_request(method):
     """
     Send cleaning request to API.
@@ -164,189 +272,198 @@ def send_cleaning_request(method):
         pass  # Ignore errors for demo
 
 # ------------------------
-# MAIN
+# SECTIONS
 # ------------------------
-st.markdown("## ☀️ Solar Edge AI Dashboard")
-st.caption("Raspberry Pi → Edge AI → API → Mobile Dashboard")
-
-# Add refresh button
-col_refresh = st.columns([5, 1])
-with col_refresh[1]:
-    if st.button("🔄 Refresh", key="refresh_btn"):
-        st.rerun()
-
-solar = fetch_solar_data()
-weather_raw = fetch_weather()
-
-if solar is None or "error" in solar or weather_raw is None:
-    st.error("Unable to connect to Edge API or Weather Service")
-    st.stop()
-
-weather = calculate_weather_summary(weather_raw)
-
-# Save history
-# Safely choose a time key from the solar summary. If missing, use current time.
-if "date" in solar:
-    time_key = "date"
-elif "timestamp" in solar:
-    time_key = "timestamp"
-else:
-    time_key = None
-
-if time_key and time_key in solar:
-    time_value = solar[time_key]
-else:
-    # Fall back to standard datetime format
-    time_value = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-# Determine problem based on system status
-problem = "None"
-if solar.get("dust_detected"):
-    problem = "Dust Detected"
-elif solar.get("vision_label") == "BirdDroppings":
-    problem = "Bird Droppings"
-elif solar.get("vision_label") == "ElectricalDamage":
-    problem = "Electrical Damage"
-elif solar.get("avg_loss_percent", 0) > 20:
-    problem = f"High Loss ({solar.get('avg_loss_percent')}%)"
-
-history_row = {
-    "time": time_value,
-    "expected_power": solar.get("expected_power"),
-    "actual_power": solar.get("expected_power", 0) * (1 - solar.get("avg_loss_percent", 0) / 100),
-    "avg_loss_percent": solar.get("avg_loss_percent"),
-    "health_score": solar.get("health_score"),
-    "vision_label": solar.get("vision_label"),
-    "problem": problem
-}
-save_history(history_row)
-
-history_df = load_history()
+# Each section is a fragment: interacting with a widget inside it only reruns
+# that section, and every section pulls its data from the cached loaders.
+# Live sections also rerun on their own every REFRESH_SECONDS.
+
+def timed_section(func):
+    """Show how long a section took, on full page runs and on fragment reruns alike."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        st.caption(f"⏱ {func.__name__} rendered in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return wrapper
+
+@st.fragment(run_every=REFRESH_SECONDS)
+@timed_section
+def status_section():
+    solar = current_solar()
+    weather_raw = fetch_weather()
+    weather = calculate_weather_summary(weather_raw) if weather_raw else {"rain_expected": False}
+
+    # Runs on every live refresh, so new edge summaries reach the history without a full reload.
+    # Same guard as the page body: skip API errors and "no summary yet" responses.
+    if solar and "error" not in solar and "expected_power" in solar:
+        save_history(build_history_row(solar))
+
+    # ------------------------
+    # STATUS CARD
+    # ------------------------
+    status, status_class, status_reason = system_decision(
+        solar.get("dust_detected", False),
+        solar.get("vision_label", "Clean"),
+        solar.get("avg_loss_percent", 0),
+        weather["rain_expected"]
+    )
+
+    st.markdown(f"""
+    <div class="card">
+        <div class="{status_class}">{status}</div>
+        <div>{status_reason}</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # ------------------------
+    # CLEANING OPTIONS
+    # ------------------------
+    if "ACTION REQUIRED" in status or "CLEANING REQUIRED" in status:
+        st.markdown("### 🧹 Select Cleaning Method")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if st.button("🤖 Robot Cleaning"):
+                send_cleaning_request("robot")
+                st.success("Cleaning request sent to Robot!")
+        
+        with col2:
+            if st.button("💧 Pressurized Water"):
+                send_cleaning_request("pressurized_water")
+                st.success("Cleaning request sent to Pressurized Water system!")
+        
+        with col3:
+            if st.button("👷 Cleaning Agency"):
+                send_cleaning_request("cleaning_agency")
+                st.success("Cleaning request sent to Cleaning Agency!")
+
+@st.fragment
+@timed_section
+def panel_image_section():
+    solar = current_solar()
+    if "panel_image" not in solar:
+        return
 
-# ------------------------
-# STATUS CARD
-# ------------------------
-status, status_class, status_reason = system_decision(
-    solar.get("dust_detected", False),
-    solar.get("vision_label", "Clean"),
-    solar.get("avg_loss_percent", 0),
-    weather["rain_expected"]
-)
+    # Decoding and shipping the image is skipped until it is asked for
+    if st.toggle("🖼 Show panel image", key="show_panel_image"):
+        st.image(decode_panel_image(solar["panel_image"]), caption="Panel Image", width=150)
 
-st.markdown(f"""
-<div class="card">
-    <div class="{status_class}">{status}</div>
-    <div>{status_reason}</div>
-</div>
-""", unsafe_allow_html=True)
+@st.fragment(run_every=REFRESH_SECONDS)
+@timed_section
+def metrics_section():
+    solar = current_solar()
+    col1, col2 = st.columns(2)
 
-# ------------------------
-# CLEANING OPTIONS
-# ------------------------
-if "ACTION REQUIRED" in status or "CLEANING REQUIRED" in status:
-    st.markdown("### 🧹 Select Cleaning Method")
-    col1, col2, col3 = st.columns(3)
-    
     with col1:
-        if st.button("🤖 Robot Cleaning"):
-            send_cleaning_request("robot")
-            st.success("Cleaning request sent to Robot!")
-    
-    with col2:
-        if st.button("💧 Pressurized Water"):
-            send_cleaning_request("pressurized_water")
-            st.success("Cleaning request sent to Pressurized Water system!")
-    
-    with col3:
-        if st.button("👷 Cleaning Agency"):
-            send_cleaning_request("cleaning_agency")
-            st.success("Cleaning request sent to Cleaning Agency!")
+        st.markdown("### ⚡ Expected Power")
+        st.markdown(f"<div class='big-number'>{solar.get('expected_power', 0):.0f} W</div>", unsafe_allow_html=True)
 
-# ------------------------
-# PANEL IMAGE
-# ------------------------
-if "panel_image" in solar:
-    import base64
-    image_data = base64.b64decode(solar["panel_image"])
-    st.image(image_data, caption="Panel Image", width=150)
+        st.markdown("### 🏥 Health Score")
+        st.markdown(f"<div class='big-number'>{solar.get('health_score', 0):.0f}%</div>", unsafe_allow_html=True)
 
-# ------------------------
-# METRICS
-# ------------------------
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown("### ⚡ Expected Power")
-    st.markdown(f"<div class='big-number'>{solar.get('expected_power', 0):.0f} W</div>", unsafe_allow_html=True)
-
-    st.markdown("### 🏥 Health Score")
-    st.markdown(f"<div class='big-number'>{solar.get('health_score', 0):.0f}%</div>", unsafe_allow_html=True)
-
-with col2:
-    st.markdown("### 📉 Loss %")
-    st.markdown(f"<div class='big-number'>{solar.get('avg_loss_percent', 0):.1f}%</div>", unsafe_allow_html=True)
-
-    st.markdown("### 👁 Vision")
-    st.markdown(f"<div class='big-number'>{solar.get('vision_label', 'N/A')}</div>", unsafe_allow_html=True)
-
-# ------------------------
-# ------------------------
-# FORECAST GRAPH (Dummy 7-hour forecast)
-# ------------------------
-st.markdown("## 📈 Today's Energy Forecast")
-
-hours = ["6 AM", "8 AM", "10 AM", "12 PM", "2 PM", "4 PM", "6 PM"]
-forecasted_energy = solar.get("forecasted_energy_kWh", 100)
-forecast = [
-    forecasted_energy * 0.05,
-    forecasted_energy * 0.12,
-    forecasted_energy * 0.22,
-    forecasted_energy * 0.28,
-    forecasted_energy * 0.20,
-    forecasted_energy * 0.10,
-    forecasted_energy * 0.03,
-]
-
-forecast_df = pd.DataFrame({
-    "Time": hours,
-    "Energy (kWh)": forecast
-})
-
-st.bar_chart(forecast_df.set_index("Time"), height=250)
-
-# ------------------------
-# PERFORMANCE GRAPH (HISTORICAL TRENDS)
-# ------------------------
-st.markdown("## 📊 Performance Trends")
+    with col2:
+        st.markdown("### 📉 Loss %")
+        st.markdown(f"<div class='big-number'>{solar.get('avg_loss_percent', 0):.1f}%</div>", unsafe_allow_html=True)
+
+        st.markdown("### 👁 Vision")
+        st.markdown(f"<div class='big-number'>{solar.get('vision_label', 'N/A')}</div>", unsafe_allow_html=True)
+
+@st.fragment(run_every=REFRESH_SECONDS)
+@timed_section
+def forecast_section():
+    # ------------------------
+    # FORECAST GRAPH (hourly day-ahead forecast from the edge)
+    # ------------------------
+    solar = current_solar()
+    st.markdown("## 📈 Today's Energy Forecast")
+
+    energy_forecast = solar.get("energy_forecast")
+    if energy_forecast:
+        forecast_df = pd.DataFrame(energy_forecast)
+        forecast_df["Time"] = pd.to_datetime(forecast_df["time"]).dt.strftime("%H:%M")
+        forecast_df = forecast_df.rename(columns={"energy_kWh": "Energy (kWh)"})[["Time", "Energy (kWh)"]]
+    else:
+        # Older edge nodes only send a daily total - spread it over a typical day profile
+        hours = ["6 AM", "8 AM", "10 AM", "12 PM", "2 PM", "4 PM", "6 PM"]
+        forecasted_energy = solar.get("forecasted_energy_kWh", 100)
+        forecast = [
+            forecasted_energy * 0.05,
+            forecasted_energy * 0.12,
+            forecasted_energy * 0.22,
+            forecasted_energy * 0.28,
+            forecasted_energy * 0.20,
+            forecasted_energy * 0.10,
+            forecasted_energy * 0.03,
+        ]
+
+        forecast_df = pd.DataFrame({
+            "Time": hours,
+            "Energy (kWh)": forecast
+        })
+
+    st.bar_chart(forecast_df.set_index("Time"), height=250)
+
+@st.fragment
+@timed_section
+def performance_section():
+    # ------------------------
+    # PERFORMANCE GRAPH (HISTORICAL TRENDS)
+    # ------------------------
+    st.markdown("## 📊 Performance Trends")
+
+    # Four charts are the most expensive part of the page, so they are only built on request
+    if not st.toggle("📊 Show performance trends", key="show_perf_trends"):
+        return
+    store = get_history_store(history_mtime())
 
-if len(history_df) > 0:
-    # Convert time to datetime - handle mixed formats
-    perf_df = history_df.copy()
-    perf_df["time"] = pd.to_datetime(perf_df["time"], format="mixed", utc=False)
-    
-    # Sort by time ascending
-    perf_df_sorted = perf_df.sort_values("time", ascending=True)
-    
-    # Remove rows with missing values for power metrics
-    perf_df_sorted = perf_df_sorted.dropna(subset=["expected_power", "actual_power", "health_score"])
-    
-    if len(perf_df_sorted) > 0:
-        # Create performance metrics dataframe
-        perf_display = perf_df_sorted[["time", "expected_power", "actual_power", "avg_loss_percent", "health_score"]].copy()
-        perf_display.columns = ["Time", "Expected Power", "Actual Power", "Loss %", "Health Score"]
-        perf_display = perf_display.set_index("Time")
+    if store is None:
+        st.info("No historical data available yet.")
+    elif len(store) == 0:
+        st.info("No valid performance data available yet.")
+    else:
+        # Any range is reduced to CHART_POINTS rows by the history store
+        first, last = store.time_range()
+        col_range, col_method = st.columns([4, 1])
+        with col_range:
+            if first.date() < last.date():
+                start_day, end_day = st.slider(
+                    "Date range",
+                    min_value=first.date(),
+                    max_value=last.date(),
+                    value=(first.date(), last.date()),
+                    key="perf_range"
+                )
+            else:
+                start_day, end_day = first.date(), last.date()
+        with col_method:
+            method = st.selectbox("Downsampling", ["lttb", "minmax"], key="perf_method")
+
+        perf_display = store.query(
+            start=pd.Timestamp(start_day),
+            end=pd.Timestamp(end_day) + pd.Timedelta(days=1),
+            max_points=CHART_POINTS,
+            method=method
+        )
+        perf_display = perf_display.rename(columns={
+            "expected_power": "Expected Power",
+            "actual_power": "Actual Power",
+            "avg_loss_percent": "Loss %",
+            "health_score": "Health Score"
+        })
+        st.caption(f"Showing {len(perf_display)} of {len(store)} points")
         
         # Create multi-line chart
         col_perf1, col_perf2 = st.columns(2)
         
         with col_perf1:
             st.markdown("### ⚡ Power Output Comparison")
-            power_df = perf_display[["Expected Power", "Actual Power"]].tail(20)
+            power_df = perf_display[["Expected Power", "Actual Power"]]
             st.line_chart(power_df, height=300)
         
         with col_perf2:
             st.markdown("### 🏥 System Health Score Over Time")
-            health_df = perf_display[["Health Score"]].tail(20)
+            health_df = perf_display[["Health Score"]]
             st.line_chart(health_df, height=300, color=["#2e7d32"])
         
         # Power Loss and Efficiency Trend
@@ -354,118 +471,140 @@ if len(history_df) > 0:
         
         with col_perf3:
             st.markdown("### 📉 Power Loss Percentage")
-            loss_df = perf_display[["Loss %"]].tail(20)
+            loss_df = perf_display[["Loss %"]]
             st.line_chart(loss_df, height=300, color=["#c62828"])
         
         with col_perf4:
             st.markdown("### 📈 Efficiency Ratio")
-            efficiency_df = perf_display[["Expected Power", "Actual Power"]].tail(20).copy()
+            efficiency_df = perf_display[["Expected Power", "Actual Power"]].copy()
             efficiency_df["Efficiency %"] = (efficiency_df["Actual Power"] / efficiency_df["Expected Power"] * 100).round(1)
             efficiency_chart = efficiency_df[["Efficiency %"]]
             st.line_chart(efficiency_chart, height=300, color=["#ff9800"])
-    else:
-        st.info("No valid performance data available yet.")
-else:
-    st.info("No historical data available yet.")
-
-# ------------------------
-# POWER VS DAYS
-# ------------------------
-st.markdown("## 📊 Power vs Days")
 
-if len(history_df) > 0:
-    # Convert time to datetime - handle mixed formats
-    daily_df = history_df.copy()
-    daily_df["time"] = pd.to_datetime(daily_df["time"], format="mixed", utc=False)
-    
-    # Extract date (without time)
-    daily_df["Date"] = daily_df["time"].dt.date
-    
-    # Remove rows with missing power values
-    daily_df = daily_df.dropna(subset=["expected_power", "actual_power"])
-    
-    if len(daily_df) > 0:
-        # Group by date and calculate daily totals
-        daily_summary = daily_df.groupby("Date").agg({
-            "expected_power": "sum",
-            "actual_power": "sum",
-            "health_score": "mean"
-        }).round(2)
+@st.fragment
+@timed_section
+def daily_section():
+    # ------------------------
+    # POWER VS DAYS
+    # ------------------------
+    st.markdown("## 📊 Power vs Days")
+    daily_summary = daily_summary_table(history_mtime())
+
+    if len(daily_summary) > 0:
+        # Charts and table are only built on request, like the panel image
+        if st.toggle("📊 Show Daily Charts", key="show_daily_charts"):
+            col_daily1, col_daily2 = st.columns(2)
+
+            with col_daily1:
+                st.markdown("### ⚡ Daily Power Generation")
+                power_by_day = daily_summary[["Total Expected Power", "Total Actual Power"]]
+                st.bar_chart(power_by_day, height=300)
+
+            with col_daily2:
+                st.markdown("### 📈 Daily Health Score")
+                health_by_day = daily_summary[["Avg Health Score"]]
+                st.line_chart(health_by_day, height=300, color=["#2e7d32"])
         
-        # Rename columns for display
-        daily_summary.columns = ["Total Expected Power", "Total Actual Power", "Avg Health Score"]
-        daily_summary = daily_summary.reset_index()
-        daily_summary["Date"] = daily_summary["Date"].astype(str)
-        daily_summary = daily_summary.set_index("Date")
-        
-        col_daily1, col_daily2 = st.columns(2)
+        # Display daily summary table only on request
+        if st.toggle("📋 Show Daily Summary Table", key="show_daily_table"):
+            display_daily = daily_summary.copy()
+            display_daily.columns = ["Total Expected Power (W)", "Total Actual Power (W)", "Avg Health Score (%)"]
+            st.dataframe(display_daily, use_container_width=True)
+    elif len(load_history()) > 0:
+        st.info("No valid daily power data available yet.")
+    else:
+        st.info("No historical data available yet.")
+
+@st.fragment
+@timed_section
+def last_days_section():
+    # ------------------------
+    # LAST 5 DAYS SUMMARY TABLE
+    # ------------------------
+    st.markdown("## 📅 Last 5 Days Summary")
+    history_df = load_history()
+
+    if len(history_df) > 0:
+        # Sort by time descending and take last 5 days
+        history_df_sorted = history_df.nlargest(5, "time")
         
-        with col_daily1:
-            st.markdown("### ⚡ Daily Power Generation")
-            power_by_day = daily_summary[["Total Expected Power", "Total Actual Power"]]
-            st.bar_chart(power_by_day, height=300)
+        # Reorder columns for display
+        display_df = history_df_sorted[["time", "expected_power", "actual_power", "avg_loss_percent", "problem"]].copy()
+        display_df.columns = ["Date", "Expected Power (W)", "Actual Power (W)", "Loss %", "Problem"]
         
-        with col_daily2:
-            st.markdown("### 📈 Daily Health Score")
-            health_by_day = daily_summary[["Avg Health Score"]]
-            st.line_chart(health_by_day, height=300, color=["#2e7d32"])
+        # Round power values
+        display_df["Expected Power (W)"] = display_df["Expected Power (W)"].round(1)
+        display_df["Actual Power (W)"] = display_df["Actual Power (W)"].round(1)
+        display_df = display_df.reset_index(drop=True)
         
-        # Display daily summary table
-        st.markdown("### 📋 Daily Summary Table")
-        display_daily = daily_summary.copy()
-        display_daily.columns = ["Total Expected Power (W)", "Total Actual Power (W)", "Avg Health Score (%)"]
-        st.dataframe(display_daily, use_container_width=True)
+        # Display as table
+        st.dataframe(display_df, use_container_width=True)
     else:
-        st.info("No valid daily power data available yet.")
-else:
-    st.info("No historical data available yet.")
+        st.info("No historical data available yet.")
+
+@st.fragment
+@timed_section
+def weather_section():
+    # ------------------------
+    # WEATHER
+    # ------------------------
+    weather_raw = fetch_weather()
+    st.markdown("## 🌦 Weather Conditions")
+    if not weather_raw:
+        st.info("Weather data unavailable.")
+        return
+    weather = calculate_weather_summary(weather_raw)
 
-# ------------------------
-# LAST 5 DAYS SUMMARY TABLE
-# ------------------------
-st.markdown("## 📅 Last 5 Days Summary")
+    wcol1, wcol2 = st.columns(2)
 
-if len(history_df) > 0:
-    # Convert time to datetime - handle mixed formats
-    history_df["time"] = pd.to_datetime(history_df["time"], format="mixed", utc=False)
-    
-    # Sort by time descending and take last 5 days
-    history_df_sorted = history_df.sort_values("time", ascending=False).head(5)
-    
-    # Reorder columns for display
-    display_df = history_df_sorted[["time", "expected_power", "actual_power", "avg_loss_percent", "problem"]].copy()
-    display_df.columns = ["Date", "Expected Power (W)", "Actual Power (W)", "Loss %", "Problem"]
-    
-    # Round power values
-    display_df["Expected Power (W)"] = display_df["Expected Power (W)"].round(1)
-    display_df["Actual Power (W)"] = display_df["Actual Power (W)"].round(1)
-    display_df = display_df.reset_index(drop=True)
-    
-    # Display as table
-    st.dataframe(display_df, use_container_width=True)
-else:
-    st.info("No historical data available yet.")
+    with wcol1:
+        st.write("🌧 Rain Expected:", "Yes" if weather["rain_expected"] else "No")
+        st.write("☁ Cloud Cover:", f"{weather['cloud_cover_percent']} %")
+        st.write("💧 Humidity:", f"{weather['humidity_percent']} %")
+
+    with wcol2:
+        st.write("🌬 Wind Speed:", f"{weather['wind_speed_kmh']} km/h")
+        st.write("🌞 Current UV:", weather.get("uv_index", 0))
+        st.write("☀️ Max UV Today:", weather.get("uv_index_max", 0))
 
 # ------------------------
-# WEATHER
+# MAIN
 # ------------------------
-st.markdown("## 🌦 Weather Conditions")
+render_start = time.perf_counter()
 
-wcol1, wcol2 = st.columns(2)
+st.markdown("## ☀️ Solar Edge AI Dashboard")
+st.caption("Raspberry Pi → Edge AI → API → Mobile Dashboard")
+
+# Add refresh button
+col_refresh = st.columns([5, 1])
+with col_refresh[1]:
+    if st.button("🔄 Refresh", key="refresh_btn"):
+        # Drop cached responses so the rerun fetches fresh data
+        fetch_solar_data.clear()
+        fetch_weather.clear()
+        st.rerun()
 
-with wcol1:
-    st.write("🌧 Rain Expected:", "Yes" if weather["rain_expected"] else "No")
-    st.write("☁ Cloud Cover:", f"{weather['cloud_cover_percent']} %")
-    st.write("💧 Humidity:", f"{weather['humidity_percent']} %")
+solar = fetch_solar_data()
+weather_raw = fetch_weather()
+
+if solar is None or "error" in solar or weather_raw is None:
+    # Don't keep a failed response around for the whole TTL
+    fetch_solar_data.clear()
+    fetch_weather.clear()
+    st.error("Unable to connect to Edge API or Weather Service")
+    st.stop()
 
-with wcol2:
-    st.write("🌬 Wind Speed:", f"{weather['wind_speed_kmh']} km/h")
-    st.write("🌞 Current UV:", weather.get("uv_index", 0))
-    st.write("☀️ Max UV Today:", weather.get("uv_index_max", 0))
+status_section()
+panel_image_section()
+metrics_section()
+forecast_section()
+performance_section()
+daily_section()
+last_days_section()
+weather_section()
 
 st.caption("Powered by Raspberry Pi Edge AI • Open-Meteo • Streamlit")
+st.caption(f"⏱ Page rendered in {(time.perf_counter() - render_start) * 1000:.0f} ms")
 
-# Remove auto-refresh - user controls it with button
-# Uncomment below if you want auto-refresh
-# time.sleep(REFRESH_SECONDS)
-# st.rerun()
+# No full-page auto-refresh: status, metrics and forecast refresh themselves as
+# fragments every REFRESH_SECONDS; the Refresh button reloads everything else.
@@ -0,0 +1,86 @@
+import numpy as np
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: pick n_out row indices that keep the visual shape of y(x).
+    x, y: 1-D numeric arrays of equal length, x sorted ascending.
+    """
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1])[:max(n_out, 0)]
+
+    x = np.asarray(x, dtype=float) - float(x[0])
+    y = np.asarray(y, dtype=float)
+
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            avg_x = x[edges[i + 1]:edges[i + 2]].mean()
+            avg_y = y[edges[i + 1]:edges[i + 2]].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+
+    return indices
+
+def minmax_indices(y, n_out):
+    """
+    Min-max bucketing: keep the lowest and highest point of each bucket so peaks survive.
+    Returns at most n_out sorted row indices.
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+
+    n_buckets = max(1, n_out // 2)
+    size = -(-n // n_buckets)  # ceil division
+
+    # Pad to equal-sized buckets so argmin/argmax run over all buckets at once
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    buckets = padded.reshape(n_buckets, size)
+    starts = np.arange(n_buckets) * size
+
+    valid = starts < n
+    lows = starts + np.argmin(np.where(np.isnan(buckets), np.inf, buckets), axis=1)
+    highs = starts + np.argmax(np.where(np.isnan(buckets), -np.inf, buckets), axis=1)
+
+    return np.unique(np.concatenate([lows[valid], highs[valid]]))
+
+def downsample_indices(x, values, n_out, method="lttb"):
+    """
+    Row indices reducing a multi-column series to at most n_out rows.
+    values: 2-D array (n_rows, n_columns). Each column gets an equal share of the
+    budget and the picked rows are merged, so all columns stay aligned on the same rows.
+    """
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+
+    values = np.asarray(values, dtype=float).reshape(n, -1)
+    share = max(3, n_out // values.shape[1])
+
+    picked = []
+    for column in values.T:
+        if method == "lttb":
+            picked.append(lttb_indices(x, column, share))
+        elif method == "minmax":
+            picked.append(minmax_indices(column, share))
+        else:
+            raise ValueError(f"Unknown downsampling method: {method}")
+
+    return np.unique(np.concatenate(picked))
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from downsample import downsample_indices, minmax_indices
+
+HISTORY_COLUMNS = ["expected_power", "actual_power", "avg_loss_percent", "health_score"]
+
+LEVEL_FACTOR = 4        # Each level keeps ~1/4 of the rows of the level below
+MIN_LEVEL_ROWS = 1000   # Stop building levels once they get this small
+OVERSAMPLE = 4          # Query the finest level with at most max_points * OVERSAMPLE rows in range
+DEFAULT_MAX_POINTS = 500
+
+class HistoryStore:
+    """
+    Time series history with pre-computed multi-resolution levels.
+    Level 0 is the raw data; every level above is a min-max reduction of the one
+    below, so peaks and dips survive at every zoom level. Queries pick the coarsest
+    level that still has enough points in range and downsample it to a fixed budget.
+    """
+
+    def __init__(self, df, time_column="time", columns=None):
+        self.columns = columns or [c for c in HISTORY_COLUMNS if c in df.columns]
+
+        df = df.dropna(subset=[time_column] + self.columns).sort_values(time_column)
+        times = pd.to_datetime(df[time_column]).to_numpy(dtype="datetime64[ns]")
+        values = df[self.columns].to_numpy(dtype=float)
+
+        self.levels = [(times, values)]
+        while len(times) > MIN_LEVEL_ROWS:
+            keep = self._reduce(values, len(times) // LEVEL_FACTOR)
+            times, values = times[keep], values[keep]
+            self.levels.append((times, values))
+
+    @staticmethod
+    def _reduce(values, n_out):
+        """Min-max row selection per column, merged so rows stay aligned."""
+        share = max(2, n_out // values.shape[1])
+        return np.unique(np.concatenate([minmax_indices(column, share) for column in values.T]))
+
+    def __len__(self):
+        return len(self.levels[0][0])
+
+    def time_range(self):
+        times = self.levels[0][0]
+        if len(times) == 0:
+            return None, None
+        return pd.Timestamp(times[0]), pd.Timestamp(times[-1])
+
+    def query(self, start=None, end=None, columns=None, max_points=DEFAULT_MAX_POINTS, method="lttb"):
+        """
+        Rows between start and end (inclusive), reduced to at most max_points.
+        Returns a DataFrame indexed by time with the requested columns.
+        """
+        columns = columns or self.columns
+        column_idx = [self.columns.index(c) for c in columns]
+
+        lo_time = np.datetime64(pd.Timestamp(start), "ns") if start is not None else None
+        hi_time = np.datetime64(pd.Timestamp(end), "ns") if end is not None else None
+
+        # Walk from the finest level up until the range fits the budget
+        for times, values in self.levels:
+            lo = 0 if lo_time is None else np.searchsorted(times, lo_time, side="left")
+            hi = len(times) if hi_time is None else np.searchsorted(times, hi_time, side="right")
+            if hi - lo <= max_points * OVERSAMPLE:
+                break
+
+        times, values = times[lo:hi], values[lo:hi][:, column_idx]
+        keep = downsample_indices(times.astype("int64"), values, max_points, method=method)
+
+        frame = pd.DataFrame(values[keep], columns=columns, index=pd.DatetimeIndex(times[keep], name="time"))
+        return frame
@@ -1,20 +1,33 @@
-import json
-import time
 import requests
 from datetime import datetime
 import random  # For simulation
 import base64
 import os
+import argparse
 
-from inference.sensor_client import get_sensor_data
+from sensors.acquisition import Acquisition, SAMPLE_HZ, WINDOW_SECONDS
+from sensors.drivers import make_driver
 from inference.predict_power import predict_expected_power
-from inference.classify_dust import classify_panel
+from inference.classify_dust import classify_panel, set_keep_loaded
+from inference.forecast_engine import ForecastEngine, SITES
+from scheduler import AdaptiveScheduler, POLICIES, DEFAULT_POLICY
+from memory_monitor import MemoryMonitor, SNAPSHOT_SECONDS, MEMORY_PORT
 
 BASE_DIR = os.path.dirname(__file__)
 IMAGE_PATH = os.path.join(BASE_DIR, "images", "clean1.jpeg")
 print(f"Image path: {IMAGE_PATH}")
 API_URL = "http://127.0.0.1:5000/api/summary"
 
+# Day-ahead forecast, only recomputed when open-meteo publishes a new run
+forecast_engine = ForecastEngine()
+
+# Last vision result, reused for windows where the scheduler skips vision
+last_vision_label = "Clean"
+
+# Base64 panel image keyed by (path, mtime), so it is only re-encoded when the file changes
+_image_cache = {}
+_cache_image = True  # Turned off by the memory budget
+
 def check_internet():
     """
     Check if internet is available.
@@ -25,18 +38,6 @@ def check_internet():
     except:
         return False
 
-def simulate_sensors():
-    """
-    Simulate solar sensor data.
-    In production, this would read from actual sensors.
-    """
-    return {
-        "irradiation": round(random.uniform(200, 1000), 2),
-        "ambient_temp": round(random.uniform(20, 40), 2),
-        "module_temp": round(random.uniform(25, 50), 2),
-        "wind_speed": round(random.uniform(0, 10), 2)
-    }
-
 def compute_loss_percent(sensor_data, vision_label):
     """
     Compute average loss percentage based on sensor data and vision label.
@@ -61,28 +62,78 @@ def compute_loss_percent(sensor_data, vision_label):
     
     return round(final_loss, 2)
 
-def run_edge():
+def get_panel_image(path=IMAGE_PATH):
+    """Base64-encoded panel image, cached until the file changes."""
+    if not _cache_image:
+        with open(path, "rb") as img_file:
+            return base64.b64encode(img_file.read()).decode('utf-8')
+    key = (path, os.path.getmtime(path))
+    if key not in _image_cache:
+        _image_cache.clear()
+        with open(path, "rb") as img_file:
+            _image_cache[key] = base64.b64encode(img_file.read()).decode('utf-8')
+    return _image_cache[key]
+
+def set_image_caching(enabled):
+    """Memory-budget hook: with enabled=False the image is re-read on every window instead of cached."""
+    global _cache_image
+    _cache_image = enabled
+    if not enabled:
+        _image_cache.clear()
+
+def register_shrinkers(monitor, acquisition):
     """
-    Run edge AI once and send summary.
+    Low-memory modes, engaged cheapest-first while RSS stays over budget.
+    Image caching and keeping YOLO loaded come back once RSS is under the low-water mark.
     """
-    print("\n🌐 Running edge AI...")
+    monitor.register_shrinker("image cache", lambda: set_image_caching(False), restore=lambda: set_image_caching(True))
+    monitor.register_shrinker("memory history", monitor.shrink_history)
+    monitor.register_shrinker("sensor buffers", acquisition.shrink)
+    monitor.register_shrinker("vision model", lambda: set_keep_loaded(False), restore=lambda: set_keep_loaded(True))
 
-    sensor_data = simulate_sensors()
-    print("Sensor data:", sensor_data)
+def build_summary(window, scheduler):
+    """
+    Run edge AI once for an aggregated sensor window and return the summary
+    (None when the window has nothing new to report).
+    The scheduler decides whether power inference and vision run for this window.
+    """
+    global last_vision_label
 
-    expected_power = predict_expected_power(sensor_data)
+    sensor_data = window["mean"]
+    decision = scheduler.decide(window["end"], sensor_data)
+    print(f"\n🌐 Running edge AI ({decision['reason']})...")
+    print(f"Sensor data ({window['samples']} samples):", sensor_data)
+
+    if decision["run_power"]:
+        hour = datetime.fromtimestamp(window["end"]).hour
+        expected_power = predict_expected_power(dict(sensor_data, hour=hour))
+        scheduler.mark_ran(window["end"], power=True)
+    elif decision["mode"] == "night":
+        expected_power = 0.0
+    else:
+        expected_power = None
     print("Expected Power:", expected_power, "W")
 
-    vision_label = classify_panel(IMAGE_PATH)
-    print("Vision Label:", vision_label)
+    if expected_power is None:
+        # Low-light window with neither power nor vision due: nothing new to report
+        print("⏭ Skipping window")
+        return None
+
+    if decision["run_vision"]:
+        last_vision_label = classify_panel(IMAGE_PATH)
+        scheduler.mark_ran(window["end"], vision=True)
+        print("Vision Label:", last_vision_label)
+    else:
+        print("Vision Label (cached):", last_vision_label)
+    vision_label = last_vision_label
 
     avg_loss_percent = compute_loss_percent(sensor_data, vision_label)
     health_score = 100 - avg_loss_percent
     dust_detected = vision_label == "Dust"
+    if decision["run_vision"]:
+        scheduler.observe(window["end"], avg_loss_percent, health_score)
 
-    # Encode image
-    with open(IMAGE_PATH, "rb") as img_file:
-        image_data = base64.b64encode(img_file.read()).decode('utf-8')
+    image_data = get_panel_image()
 
     summary = {
         "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -91,9 +142,34 @@ def run_edge():
         "vision_label": vision_label,
         "dust_detected": dust_detected,
         "health_score": health_score,
-        "panel_image": image_data
+        "panel_image": image_data,
+        "schedule_mode": decision["mode"],
+        "sensor_window": {
+            "samples": window["samples"],
+            "min": window["min"],
+            "max": window["max"]
+        }
     }
 
+    forecast_engine.refresh()
+    site_id = SITES[0]["site_id"]
+    if forecast_engine.hourly(site_id):
+        summary["forecasted_energy_kWh"] = forecast_engine.daily_energy_kwh(site_id)
+        summary["energy_forecast"] = [
+            {"time": h["time"], "energy_kWh": h["energy_kWh"]}
+            for h in forecast_engine.hourly(site_id)
+        ]
+
+    return summary
+
+def run_edge(window, scheduler):
+    """
+    Run edge AI once for an aggregated sensor window and send summary.
+    """
+    summary = build_summary(window, scheduler)
+    if summary is None:
+        return
+
     response = requests.post(API_URL, json=summary, timeout=10)
     if response.status_code == 200:
         print("Summary sent successfully")
@@ -101,14 +177,49 @@ def run_edge():
         print(f"Failed to send: {response.status_code}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Edge AI runner")
+    parser.add_argument("--driver", choices=["simulated", "modbus"], default="simulated")
+    parser.add_argument("--modbus-host", default="127.0.0.1")
+    parser.add_argument("--modbus-port", type=int, default=5020)
+    parser.add_argument("--sample-hz", type=float, default=SAMPLE_HZ)
+    parser.add_argument("--window", type=float, default=WINDOW_SECONDS, help="Aggregation window in seconds")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default=DEFAULT_POLICY, help="Adaptive scheduling policy")
+    parser.add_argument("--memory-budget", type=float, help="RSS budget in MB; caches, buffers and batches shrink above it")
+    parser.add_argument("--memory-interval", type=float, default=SNAPSHOT_SECONDS, help="Seconds between memory snapshots")
+    parser.add_argument("--memory-port", type=int, default=MEMORY_PORT, help="Local port for GET /memory (0 to disable)")
+    parser.add_argument("--trace-memory", action="store_true", help="Include tracemalloc top-N allocation sites in snapshots")
+    args = parser.parse_args()
+
+    if args.driver == "modbus":
+        driver = make_driver("modbus", host=args.modbus_host, port=args.modbus_port)
+    else:
+        driver = make_driver("simulated")
+
     print("🚀 Starting Edge AI Runner with continuous monitoring...")
-    print("📊 Data will be updated every 5 seconds")
+    print(f"📊 Sampling at {args.sample_hz} Hz, inference every {args.window:.0f} s window")
     print("Press Ctrl+C to stop\n")
-    
+
+    scheduler = AdaptiveScheduler(args.policy)
+    acquisition = Acquisition(driver, sample_hz=args.sample_hz, window_seconds=args.window).start()
+
+    monitor = MemoryMonitor(budget_mb=args.memory_budget, interval=args.memory_interval, trace=args.trace_memory)
+    register_shrinkers(monitor, acquisition)
+    monitor.start()
+    if args.memory_port:
+        monitor.serve(args.memory_port)
+
     try:
         while True:
-            run_edge()
-            print("⏳ Waiting 5 seconds before next update...\n")
-            time.sleep(5)  # Update every 5 seconds
+            window = acquisition.next_window()
+            if window["samples"] == 0:
+                print("⚠️ No sensor samples in window, skipping")
+                continue
+            try:
+                run_edge(window, scheduler)
+            except requests.RequestException as e:
+                print("API Error:", e)
     except KeyboardInterrupt:
         print("\n🛑 Edge AI Runner stopped by user")
+    finally:
+        acquisition.stop()
+        monitor.stop()
@@ -1,12 +1,17 @@
 import os
-from ultralytics import YOLO
 
 # Absolute path to model
 BASE_DIR = os.path.dirname(__file__)
 MODEL_PATH = os.path.join(BASE_DIR, "..", "model", "best1.pt")
 
-# Load YOLO model once
-model = YOLO(MODEL_PATH)
+# YOLO (and torch) are loaded on first use, so night-only or power-only runs never pay for them
+model = None
+
+# Cleared by the memory budget: YOLO is then dropped after every classification
+keep_loaded = True
+
+# Classification attempts and how many of them fell back to "Clean" on an error
+stats = {"runs": 0, "errors": 0}
 
 CLASS_NAMES = [
     "Clean",
@@ -15,9 +20,29 @@ CLASS_NAMES = [
     "ElectricalDamage"
 ]
 
+def load_model():
+    global model
+    if model is None:
+        from ultralytics import YOLO
+        model = YOLO(MODEL_PATH)
+    return model
+
+def unload_model():
+    """Drop the YOLO model to free memory; it is reloaded on the next classification."""
+    global model
+    model = None
+
+def set_keep_loaded(keep):
+    """Memory-budget hook: with keep=False the model is unloaded after each classification."""
+    global keep_loaded
+    keep_loaded = keep
+    if not keep:
+        unload_model()
+
 def classify_panel(image_path):
+    stats["runs"] += 1
     try:
-        results = model(image_path, verbose=False)
+        results = load_model()(image_path, verbose=False)
         print(f"Vision results: {len(results[0].boxes)} boxes found")
 
         if len(results[0].boxes) == 0:
@@ -33,4 +58,9 @@ def classify_panel(image_path):
 
     except Exception as e:
         print("Vision Error:", e)
+        stats["errors"] += 1
         return "Clean"  # Changed to "Clean" instead of "Unknown"
+
+    finally:
+        if not keep_loaded:
+            unload_model()
@@ -0,0 +1,137 @@
+import time
+import numpy as np
+
+from inference.predict_power import FEATURES, predict_expected_power_batch
+from weather.weather_client import get_hourly_forecast
+
+# Sites covered by the day-ahead forecast
+SITES = [
+    {"site_id": "plant_1", "plant_id": "4135001", "latitude": 12.9184, "longitude": 79.1325},
+]
+
+NOCT = 45.0             # Nominal operating cell temperature (°C)
+CLEAR_SKY_PEAK = 1000.0  # Clear-sky irradiance at solar noon (W/m²)
+REFRESH_SECONDS = 3600   # open-meteo publishes new model runs hourly
+RETRY_SECONDS = 300      # Wait between attempts while offline
+
+def _column(hourly, key, n_hours):
+    """Return an hourly open-meteo array as floats (missing values -> NaN)."""
+    if key not in hourly:
+        return np.full(n_hours, np.nan)
+    return np.array(hourly[key], dtype=float)
+
+def _clear_sky_from_cloud_cover(times, cloud_cover):
+    """
+    Estimate irradiance when the forecast has no radiation field.
+    Bell-shaped clear-sky day (6 AM - 6 PM) attenuated by cloud cover (Kasten-Czeplak).
+    """
+    hours = np.array([int(t[11:13]) for t in times], dtype=float)
+    clear_sky = CLEAR_SKY_PEAK * np.clip(np.sin(np.pi * (hours - 6) / 12), 0, None)
+    return clear_sky * (1 - 0.75 * (np.nan_to_num(cloud_cover) / 100) ** 3.4)
+
+def hourly_to_features(hourly):
+    """
+    Map open-meteo hourly arrays to the model feature matrix.
+    Returns an array of shape (n_hours, len(FEATURES)), columns in FEATURES order.
+    """
+    times = hourly["time"]
+    n_hours = len(times)
+
+    ambient_temp = np.nan_to_num(_column(hourly, "temperature_2m", n_hours), nan=25.0)
+    wind_speed = np.nan_to_num(_column(hourly, "wind_speed_10m", n_hours))
+    irradiation = _column(hourly, "shortwave_radiation", n_hours)
+
+    missing = np.isnan(irradiation)
+    if missing.any():
+        estimate = _clear_sky_from_cloud_cover(times, _column(hourly, "cloud_cover", n_hours))
+        irradiation[missing] = estimate[missing]
+
+    # NOCT module temperature model with wind cooling correction
+    module_temp = ambient_temp + irradiation / 800 * (NOCT - 20) * 9.5 / (5.7 + 3.8 * wind_speed)
+
+    columns = {
+        "hour": np.array([int(t[11:13]) for t in times], dtype=float),
+        "irradiation": irradiation,
+        "ambient_temp": ambient_temp,
+        "module_temp": module_temp
+    }
+    return np.round(np.column_stack([columns[name] for name in FEATURES]), 2)
+
+class ForecastEngine:
+    """
+    Day-ahead energy forecast for all sites.
+    Predictions are cached per (site_id, forecast hour) and only recomputed
+    when a newer forecast changes that hour's inputs.
+    """
+
+    def __init__(self, sites=None):
+        self.sites = sites or SITES
+        self._cache = {}  # (site_id, hour) -> (feature_row, expected_power)
+        self._forecast = {}
+        self._last_fetch = 0.0
+        self._last_attempt = 0.0
+
+    def update(self, hourly_by_site):
+        """
+        Compute forecasts from open-meteo hourly arrays ({site_id: hourly_dict}).
+        All stale hours across all sites are predicted in one vectorized call.
+        """
+        keys, rows = [], []
+        for site_id, hourly in hourly_by_site.items():
+            features = hourly_to_features(hourly)
+            for hour, row in zip(hourly["time"], features):
+                keys.append((site_id, hour))
+                rows.append(row)
+
+        stale = [
+            i for i, key in enumerate(keys)
+            if key not in self._cache or not np.array_equal(self._cache[key][0], rows[i])
+        ]
+        if stale:
+            stale_rows = np.array([rows[i] for i in stale])
+            powers = predict_expected_power_batch(stale_rows)
+            # No sun, no power - the regressor is not trained to return 0 at night
+            powers[stale_rows[:, FEATURES.index("irradiation")] <= 0] = 0.0
+            for i, power in zip(stale, np.clip(powers, 0, None)):
+                self._cache[keys[i]] = (rows[i], float(power))
+
+        # Drop hours that are no longer part of any forecast
+        current = set(keys)
+        self._cache = {key: value for key, value in self._cache.items() if key in current}
+
+        self._forecast = {}
+        for site_id, hour in keys:
+            power = self._cache[(site_id, hour)][1]
+            self._forecast.setdefault(site_id, []).append({
+                "time": hour,
+                "expected_power": round(power, 2),
+                "energy_kWh": round(power / 1000, 3)  # 1-hour step: W -> kWh
+            })
+
+        self._last_fetch = time.time()
+        print(f"Forecast updated: {len(stale)}/{len(keys)} hours recomputed")
+        return self._forecast
+
+    def refresh(self, max_age_seconds=REFRESH_SECONDS):
+        """
+        Fetch a new open-meteo forecast if the current one is older than max_age_seconds.
+        Keeps the previous forecast if the fetch fails, and waits RETRY_SECONDS before retrying.
+        """
+        now = time.time()
+        if now - self._last_fetch < max_age_seconds or now - self._last_attempt < RETRY_SECONDS:
+            return self._forecast
+        self._last_attempt = now
+
+        try:
+            hourly_by_site = get_hourly_forecast(self.sites)
+        except Exception as e:
+            print("Forecast Error:", e)
+            return self._forecast
+
+        return self.update(hourly_by_site)
+
+    def hourly(self, site_id):
+        return self._forecast.get(site_id, [])
+
+    def daily_energy_kwh(self, site_id):
+        return round(sum(h["energy_kWh"] for h in self.hourly(site_id)), 2)
@@ -1,26 +1,54 @@
 import os
+from datetime import datetime
+
 import joblib
+import numpy as np
+import pandas as pd
 
 # Build absolute path
 BASE_DIR = os.path.dirname(__file__)
 MODEL_PATH = os.path.join(BASE_DIR, "..", "model", "expected_power_model.pkl")
 
+# Feature order used for batch rows, and the column each maps to in the
+# training data (edge/cleandataset.ipynb)
+FEATURES = ["hour", "irradiation", "ambient_temp", "module_temp"]
+MODEL_COLUMNS = {
+    "hour": "hour",
+    "irradiation": "IRRADIATION",
+    "ambient_temp": "AMBIENT_TEMPERATURE",
+    "module_temp": "MODULE_TEMPERATURE"
+}
+
 # Load ML model once
 model = joblib.load(MODEL_PATH)
 
+_columns = [MODEL_COLUMNS[name] for name in FEATURES]
+if hasattr(model, "feature_names_in_") and list(model.feature_names_in_) != _columns:
+    raise ValueError(f"Model expects features {list(model.feature_names_in_)}, got {_columns}")
+
 def predict_expected_power(sensor_data):
     """
     sensor_data = {
-        "irradiation": float,
+        "irradiation": float,   # W/m²
         "ambient_temp": float,
-        "module_temp": float
+        "module_temp": float,
+        "hour": int             # optional, hour of day; defaults to now
     }
     """
-    features = [[
-        sensor_data["irradiation"],
-        sensor_data["ambient_temp"],
-        sensor_data["module_temp"],
-        sensor_data["wind_speed"]
-    ]]
-
-    return round(float(model.predict(features)[0]), 2)
+    row = dict(sensor_data)
+    row.setdefault("hour", datetime.now().hour)
+
+    return float(predict_expected_power_batch([[row[name] for name in FEATURES]])[0])
+
+def predict_expected_power_batch(features):
+    """
+    Vectorized prediction for many rows at once.
+    features: array-like of shape (n_rows, len(FEATURES)), columns in FEATURES order
+    Returns a float numpy array of expected power (W), one per row.
+    """
+    features = np.asarray(features, dtype=float).reshape(-1, len(FEATURES))
+    if features.shape[0] == 0:
+        return np.zeros(0)
+
+    frame = pd.DataFrame(features, columns=_columns)
+    return np.round(model.predict(frame).astype(float), 2)
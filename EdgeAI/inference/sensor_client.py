@@ -1,13 +1,11 @@
-import random
+from sensors.drivers import CHANNELS, SimulatedDriver
+
+# Shared simulator so consecutive calls continue the same signal
+_driver = SimulatedDriver()
 
 def get_sensor_data():
     """
     Simulated Raspberry Pi sensor readings
-    Replace with GPIO / I2C / Modbus in real hardware
+    For real hardware use a sensors.drivers.ModbusTCPDriver with sensors.acquisition.Acquisition
     """
-    return {
-        "irradiation": round(random.uniform(400, 1000), 2),
-        "ambient_temp": round(random.uniform(25, 40), 2),
-        "module_temp": round(random.uniform(30, 55), 2),
-        "wind_speed": round(random.uniform(0.5, 6.0), 2)
-    }
+    return dict(zip(CHANNELS, _driver.read()))
@@ -0,0 +1,219 @@
+import collections
+import gc
+import json
+import threading
+import tracemalloc
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SNAPSHOT_SECONDS = 60
+TOP_N = 10
+HISTORY_LENGTH = 1440  # One day of snapshots at the default interval
+SHRUNK_HISTORY_LENGTH = 60
+LOW_WATER = 0.9        # Low-memory modes are released once RSS drops below this fraction of the budget
+MEMORY_PORT = 5081
+
+def rss_mb():
+    """Current resident set size of this process in MB."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1e6
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1e3
+    except OSError:
+        pass
+    try:
+        # Peak rather than current RSS, but better than nothing (kB on Linux, bytes on macOS)
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+    except ImportError:
+        return None
+
+class MemoryMonitor:
+    """
+    Periodic memory snapshots (RSS plus tracemalloc top-N allocation sites) and
+    an optional memory budget.
+    While RSS exceeds the budget, registered shrinkers switch on low-memory modes in
+    order (cheapest first), one more per snapshot, and the ones already on are applied
+    again. Snapshots are kept in a bounded history and served as JSON on a local endpoint.
+    """
+
+    def __init__(self, budget_mb=None, interval=SNAPSHOT_SECONDS, top_n=TOP_N, trace=True, log=True):
+        self.budget_mb = budget_mb
+        self.interval = interval
+        self.top_n = top_n
+        self.trace = trace
+        self.log = log
+
+        self.history = collections.deque(maxlen=HISTORY_LENGTH)
+        self._shrinkers = []
+        self._shrink_level = 0  # Number of shrinkers currently engaged
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._server = None
+
+    def register_shrinker(self, name, func, restore=None):
+        """
+        func() switches on a low-memory mode (stop caching, shrink a buffer, unload a model)
+        and must be safe to call repeatedly; restore() switches it back off.
+        """
+        self._shrinkers.append((name, func, restore))
+
+    def snapshot(self):
+        """Take one snapshot, enforce the budget and return the snapshot dict."""
+        entry = {
+            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "rss_mb": rss_mb()
+        }
+
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            entry["traced_mb"] = round(current / 1e6, 2)
+            entry["traced_peak_mb"] = round(peak / 1e6, 2)
+            stats = tracemalloc.take_snapshot().statistics("lineno")[:self.top_n]
+            entry["top"] = [
+                {"where": str(stat.traceback), "size_kb": round(stat.size / 1e3, 1), "count": stat.count}
+                for stat in stats
+            ]
+
+        entry["shrunk"] = self.enforce_budget(entry["rss_mb"])
+        if entry["shrunk"]:
+            entry["rss_after_mb"] = rss_mb()
+
+        with self._lock:
+            self.history.append(entry)
+
+        if self.log:
+            self._log(entry)
+        return entry
+
+    def enforce_budget(self, current_mb=None):
+        """
+        Called on every snapshot; returns the names of the shrinkers applied.
+        Over budget: engage one more shrinker and re-apply the engaged ones, since caches
+        refill and models reload. Between LOW_WATER x budget and the budget: leave the
+        modes as they are. Below LOW_WATER x budget: restore them.
+        """
+        if self.budget_mb is None:
+            return []
+        current_mb = current_mb if current_mb is not None else rss_mb()
+        if current_mb is None:
+            return []
+
+        if current_mb < self.budget_mb * LOW_WATER:
+            if self._shrink_level:
+                self._restore()
+            return []
+        if current_mb <= self.budget_mb:
+            return []
+
+        if self._shrink_level < len(self._shrinkers):
+            self._shrink_level += 1
+        else:
+            print(f"⚠️ Still over memory budget with all shrinkers engaged: {current_mb:.1f} MB > {self.budget_mb:.0f} MB")
+
+        applied = []
+        for name, func, _ in self._shrinkers[:self._shrink_level]:
+            try:
+                func()
+                applied.append(name)
+            except Exception as e:
+                print(f"Shrinker {name} failed:", e)
+        gc.collect()
+        return applied
+
+    def _restore(self):
+        restored = []
+        for name, _, restore in reversed(self._shrinkers[:self._shrink_level]):
+            if restore is None:
+                continue
+            try:
+                restore()
+                restored.append(name)
+            except Exception as e:
+                print(f"Restoring {name} failed:", e)
+        self._shrink_level = 0
+        if restored:
+            print(f"✅ Back under memory budget, restored: {', '.join(restored)}")
+
+    def shrink_history(self):
+        """Memory-budget hook: keep only the most recent snapshots."""
+        with self._lock:
+            self.history = collections.deque(list(self.history)[-SHRUNK_HISTORY_LENGTH:], maxlen=SHRUNK_HISTORY_LENGTH)
+
+    def _log(self, entry):
+        rss = entry["rss_mb"]
+        rss_text = f"{rss:.1f} MB" if rss is not None else "n/a"
+        budget_text = f" / budget {self.budget_mb:.0f} MB" if self.budget_mb else ""
+        traced_text = f", traced {entry['traced_mb']} MB" if "traced_mb" in entry else ""
+        print(f"🧠 Memory: RSS {rss_text}{budget_text}{traced_text}")
+        if entry["shrunk"]:
+            print(f"   Over budget, shrunk: {', '.join(entry['shrunk'])}")
+        for stat in entry.get("top", [])[:3]:
+            print(f"   {stat['size_kb']:>9} kB  {stat['where']}")
+
+    def report(self):
+        """Latest snapshot plus the RSS series, as served by the endpoint."""
+        with self._lock:
+            history = list(self.history)
+        return {
+            "budget_mb": self.budget_mb,
+            "latest": history[-1] if history else None,
+            "rss_series": [(entry["time"], entry["rss_mb"]) for entry in history]
+        }
+
+    # ------------------------
+    # BACKGROUND THREAD / ENDPOINT
+    # ------------------------
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.snapshot()
+
+    def start_tracing(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def start(self):
+        if self.trace:
+            self.start_tracing()
+        self.snapshot()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve(self, port=MEMORY_PORT, host="127.0.0.1"):
+        """Serve GET /memory (JSON report) on a local port in a background thread."""
+        monitor = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") != "/memory":
+                    self.send_error(404)
+                    return
+                body = json.dumps(monitor.report()).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep the runner log clean
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        print(f"🧠 Memory endpoint: http://{host}:{port}/memory")
+        return self._server
+
+    def stop(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
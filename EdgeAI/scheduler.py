@@ -0,0 +1,169 @@
+import os
+
+# ------------------------
+# POLICIES
+# ------------------------
+# Intervals are seconds between runs; the runner checks once per sensor window,
+# so the effective cadence is rounded up to the window length.
+POLICIES = {
+    # Always run everything every window (baseline, no savings)
+    "always_on": {
+        "night_irradiance": -1.0,
+        "low_irradiance": -1.0,
+        "day_vision_interval": 0,
+        "low_vision_interval": 0,
+        "fast_vision_interval": 0,
+        "low_power_interval": 0,
+        "loss_delta": float("inf"),
+        "health_delta": float("inf"),
+        "boost_seconds": 0,
+        "cpu_limit": float("inf"),
+        "thermal_limit": float("inf"),
+        "thermal_critical": float("inf"),
+        "pressure_backoff": 1.0
+    },
+    # Default: suspend at night, slow down in low light, speed up on changes
+    "balanced": {
+        "night_irradiance": 5.0,       # W/m², below this the panel produces nothing
+        "low_irradiance": 150.0,       # W/m², dawn / dusk / heavy overcast
+        "day_vision_interval": 1800,
+        "low_vision_interval": 3600,
+        "fast_vision_interval": 0,     # Every window while loss/health is moving
+        "low_power_interval": 1800,
+        "loss_delta": 5.0,             # Loss % points between vision runs that triggers a boost
+        "health_delta": 5.0,
+        "boost_seconds": 3600,
+        "cpu_limit": 0.85,             # 1-minute load average per core
+        "thermal_limit": 70.0,         # °C, back off above this
+        "thermal_critical": 80.0,      # °C, suspend vision above this
+        "pressure_backoff": 2.0
+    },
+    # Maximum savings for battery / passively cooled deployments
+    "eco": {
+        "night_irradiance": 20.0,
+        "low_irradiance": 250.0,
+        "day_vision_interval": 3600,
+        "low_vision_interval": 7200,
+        "fast_vision_interval": 900,
+        "low_power_interval": 3600,
+        "loss_delta": 8.0,
+        "health_delta": 8.0,
+        "boost_seconds": 1800,
+        "cpu_limit": 0.7,
+        "thermal_limit": 65.0,
+        "thermal_critical": 75.0,
+        "pressure_backoff": 3.0
+    }
+}
+
+DEFAULT_POLICY = "balanced"
+THERMAL_ZONE = "/sys/class/thermal/thermal_zone0/temp"
+
+# ------------------------
+# DEVICE PRESSURE
+# ------------------------
+def read_cpu_load():
+    """1-minute load average per core, or None where unsupported (Windows)."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+def read_cpu_temp():
+    """SoC temperature in °C from the Raspberry Pi thermal zone, or None."""
+    try:
+        with open(THERMAL_ZONE) as f:
+            return int(f.read().strip()) / 1000
+    except (OSError, ValueError):
+        return None
+
+# ------------------------
+# SCHEDULER
+# ------------------------
+class AdaptiveScheduler:
+    """
+    Decides per sensor window whether to run power inference and vision.
+    - Night (irradiance ~0): both suspended, expected power is 0
+    - Low irradiance: vision and power slowed down
+    - Fast loss/health changes: vision boosted to every window for a while
+    - CPU or thermal pressure: intervals stretched, vision suspended when critical
+    """
+
+    def __init__(self, policy=DEFAULT_POLICY, cpu_probe=read_cpu_load, temp_probe=read_cpu_temp):
+        self.policy_name = policy
+        self.policy = POLICIES[policy]
+        self.cpu_probe = cpu_probe
+        self.temp_probe = temp_probe
+
+        self.last_vision = None
+        self.last_power = None
+        self.boost_until = None
+        self._last_result = None
+
+    def _pressure(self):
+        """Interval multiplier and whether vision must stop, from device load and temperature."""
+        policy = self.policy
+        cpu = self.cpu_probe() if self.cpu_probe else None
+        temp = self.temp_probe() if self.temp_probe else None
+
+        if temp is not None and temp >= policy["thermal_critical"]:
+            return policy["pressure_backoff"], True, f"thermal critical {temp:.0f}°C"
+        if temp is not None and temp >= policy["thermal_limit"]:
+            return policy["pressure_backoff"], False, f"thermal {temp:.0f}°C"
+        if cpu is not None and cpu >= policy["cpu_limit"]:
+            return policy["pressure_backoff"], False, f"cpu load {cpu:.2f}"
+        return 1.0, False, None
+
+    @staticmethod
+    def _due(last, interval, now):
+        return last is None or now - last >= interval
+
+    def decide(self, now, sensor_data):
+        """
+        Returns {"run_power", "run_vision", "mode", "reason"} for the window ending at `now`.
+        sensor_data is the window mean (needs "irradiation" in W/m²).
+        Nothing is recorded here: call mark_ran() once the work has run.
+        """
+        policy = self.policy
+        irradiation = sensor_data["irradiation"]
+        backoff, vision_blocked, pressure_reason = self._pressure()
+        boosted = self.boost_until is not None and now < self.boost_until
+
+        if irradiation <= policy["night_irradiance"]:
+            mode = "night"
+            run_power = run_vision = False
+        elif irradiation <= policy["low_irradiance"]:
+            mode = "low_light"
+            run_power = self._due(self.last_power, policy["low_power_interval"] * backoff, now)
+            vision_interval = policy["fast_vision_interval"] if boosted else policy["low_vision_interval"]
+            run_vision = self._due(self.last_vision, vision_interval * backoff, now)
+        else:
+            mode = "boost" if boosted else "day"
+            run_power = True
+            vision_interval = policy["fast_vision_interval"] if boosted else policy["day_vision_interval"]
+            run_vision = self._due(self.last_vision, vision_interval * backoff, now)
+
+        if vision_blocked:
+            run_vision = False
+
+        # A vision run needs a fresh expected power to report loss against
+        run_power = run_power or run_vision
+
+        reason = mode if pressure_reason is None else f"{mode}, {pressure_reason}"
+        return {"run_power": run_power, "run_vision": run_vision, "mode": mode, "reason": reason}
+
+    def mark_ran(self, now, power=False, vision=False):
+        """Record work that actually ran; intervals are measured from these times."""
+        if power:
+            self.last_power = now
+        if vision:
+            self.last_vision = now
+
+    def observe(self, now, loss_percent, health_score):
+        """Feed back the latest vision-based result; fast changes start a boost period."""
+        if self._last_result is not None:
+            last_loss, last_health = self._last_result
+            if (abs(loss_percent - last_loss) >= self.policy["loss_delta"]
+                    or abs(health_score - last_health) >= self.policy["health_delta"]):
+                self.boost_until = now + self.policy["boost_seconds"]
+        self._last_result = (loss_percent, health_score)
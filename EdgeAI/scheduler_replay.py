@@ -0,0 +1,130 @@
+"""
+Replay the Plant_1 weather sensor dataset through the adaptive scheduler and
+report CPU time saved against detection latency lost, compared with running
+the full pipeline every window.
+
+    python scheduler_replay.py
+    python scheduler_replay.py --events 20 --vision-cost 2.5 --policy balanced --policy eco
+"""
+import argparse
+import csv
+import os
+import random
+from datetime import datetime
+
+from scheduler import AdaptiveScheduler, POLICIES
+
+BASE_DIR = os.path.dirname(__file__)
+DATASET_PATH = os.path.join(BASE_DIR, "..", "dataset", "Plant_1_Weather_Sensor_Data.csv")
+
+# Deterministic loss per condition (edge_runner.compute_loss_percent without the noise)
+CONDITION_LOSS = {"Clean": 1.0, "Dust": 17.0, "BirdDroppings": 22.0, "ElectricalDamage": 52.0}
+FAULTS = ["Dust", "BirdDroppings", "ElectricalDamage"]
+
+def load_windows(path=DATASET_PATH):
+    """Dataset rows as (unix_time, sensor_data); IRRADIATION is kW/m² in the CSV."""
+    windows = []
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            timestamp = datetime.strptime(row["DATE_TIME"], "%Y-%m-%d %H:%M:%S").timestamp()
+            windows.append((timestamp, {
+                "irradiation": float(row["IRRADIATION"]) * 1000,
+                "ambient_temp": float(row["AMBIENT_TEMPERATURE"]),
+                "module_temp": float(row["MODULE_TEMPERATURE"]),
+                "wind_speed": 0.0
+            }))
+    return windows
+
+def make_events(windows, count, duration_hours, seed):
+    """Random, non-overlapping fault events as (start_time, end_time, label); the panel is Clean otherwise."""
+    rng = random.Random(seed)
+    starts = [windows[i][0] for i in sorted(rng.sample(range(len(windows)), count))]
+    events = []
+    for i, start in enumerate(starts):
+        # A new fault replaces the previous one, so events never overlap
+        end = start + duration_hours * 3600
+        if i + 1 < len(starts):
+            end = min(end, starts[i + 1])
+        events.append((start, end, rng.choice(FAULTS)))
+    return events
+
+def condition_at(events, now):
+    for start, end, label in events:
+        if start <= now < end:
+            return label
+    return "Clean"
+
+def replay(windows, events, policy, vision_cost, power_cost):
+    """Run one policy over the dataset; returns counts, CPU seconds and detection latencies."""
+    scheduler = AdaptiveScheduler(policy, cpu_probe=None, temp_probe=None)
+    vision_runs = power_runs = 0
+    detected = {}
+
+    for now, sensor_data in windows:
+        # Same rules as edge_runner.build_summary: only work that runs is marked
+        decision = scheduler.decide(now, sensor_data)
+        if decision["run_power"]:
+            power_runs += 1
+            scheduler.mark_ran(now, power=True)
+        if not decision["run_vision"]:
+            continue
+
+        vision_runs += 1
+        scheduler.mark_ran(now, vision=True)
+        label = condition_at(events, now)
+        loss = CONDITION_LOSS[label]
+        scheduler.observe(now, loss, 100 - loss)
+
+        for i, (start, end, event_label) in enumerate(events):
+            if i not in detected and start <= now < end and label == event_label:
+                detected[i] = now - start
+
+    latencies = sorted(detected.values())
+    return {
+        "vision_runs": vision_runs,
+        "power_runs": power_runs,
+        "cpu_seconds": vision_runs * vision_cost + power_runs * power_cost,
+        "latencies": latencies,
+        "missed": len(events) - len(detected)
+    }
+
+def _minutes(seconds_list, pick):
+    if not seconds_list:
+        return "n/a"
+    return f"{pick(seconds_list) / 60:.0f}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay report for the adaptive edge scheduler")
+    parser.add_argument("--dataset", default=DATASET_PATH)
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES), help="Policies to compare (default: all)")
+    parser.add_argument("--events", type=int, default=12, help="Number of injected fault events")
+    parser.add_argument("--event-hours", type=float, default=24.0, help="How long a fault stays before it is fixed")
+    parser.add_argument("--vision-cost", type=float, default=1.5, help="CPU seconds per YOLO run")
+    parser.add_argument("--power-cost", type=float, default=0.01, help="CPU seconds per power prediction")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    windows = load_windows(args.dataset)
+    events = make_events(windows, args.events, args.event_hours, args.seed)
+    night = sum(1 for _, s in windows if s["irradiation"] <= POLICIES["balanced"]["night_irradiance"])
+    print(f"Replaying {len(windows)} windows ({night / len(windows) * 100:.0f}% night) with {len(events)} fault events\n")
+
+    baseline = replay(windows, events, "always_on", args.vision_cost, args.power_cost)
+    policies = args.policy or sorted(POLICIES)
+
+    print(f"{'policy':<10} {'vision':>7} {'power':>7} {'cpu s':>9} {'saved':>7} "
+          f"{'lat avg':>8} {'lat p95':>8} {'lat max':>8} {'missed':>6}   (latency in minutes)")
+    for policy in policies:
+        result = baseline if policy == "always_on" else replay(windows, events, policy, args.vision_cost, args.power_cost)
+        saved = 1 - result["cpu_seconds"] / baseline["cpu_seconds"]
+        latencies = result["latencies"]
+        print(
+            f"{policy:<10} {result['vision_runs']:7d} {result['power_runs']:7d} {result['cpu_seconds']:9.0f} "
+            f"{saved * 100:6.1f}% "
+            f"{_minutes(latencies, lambda l: sum(l) / len(l)):>8} "
+            f"{_minutes(latencies, lambda l: l[min(len(l) - 1, int(0.95 * len(l)))]):>8} "
+            f"{_minutes(latencies, max):>8} {result['missed']:6d}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import collections
+import math
+import threading
+import time
+
+import numpy as np
+
+from sensors.drivers import CHANNELS
+from sensors.ring_buffer import RingBuffer
+
+SAMPLE_HZ = 1.0
+WINDOW_SECONDS = 900    # 15 minutes, same cadence as the Plant_1 dataset
+MAX_PENDING_WINDOWS = 8  # Windows not yet consumed; older ones are dropped
+
+def aggregate_window(start, end, times, values):
+    """Mean/min/max per channel for one window of samples."""
+    window = {"start": start, "end": end, "samples": len(times)}
+    if len(times) == 0:
+        return window
+
+    for stat, func in (("mean", np.mean), ("min", np.min), ("max", np.max)):
+        window[stat] = {
+            name: round(float(v), 2)
+            for name, v in zip(CHANNELS, func(values, axis=0))
+        }
+    return window
+
+class Acquisition:
+    """
+    Samples a sensor driver at a fixed rate on a background thread.
+    Samples go into a preallocated ring buffer and are aggregated into
+    fixed windows; consumers call next_window() and run inference once per window.
+    """
+
+    def __init__(self, driver, sample_hz=SAMPLE_HZ, window_seconds=WINDOW_SECONDS):
+        self.driver = driver
+        self.sample_hz = sample_hz
+        self.window_seconds = window_seconds
+
+        # Room for two full windows so the closing window is never overwritten
+        capacity = max(2, math.ceil(window_seconds * sample_hz) * 2)
+        self.buffer = RingBuffer(capacity, len(CHANNELS))
+
+        self._windows = collections.deque(maxlen=MAX_PENDING_WINDOWS)
+        self._ready = threading.Condition()
+        self._buffer_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._window_start = None
+        self.errors = 0
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.driver.close()
+
+    def sample_once(self, now):
+        """
+        Read one sample stamped `now` and close the current window if it is over.
+        Called by the sampler thread; soak tests call it directly with a simulated clock.
+        """
+        if self._window_start is None:
+            self._window_start = now
+
+        try:
+            sample = self.driver.read()
+            with self._buffer_lock:
+                self.buffer.push(now, sample)
+        except Exception as e:
+            self.errors += 1
+            print("Sensor Error:", e)
+
+        if now - self._window_start >= self.window_seconds:
+            window_end = self._window_start + self.window_seconds
+            self._close_window(self._window_start, window_end)
+            self._window_start = window_end
+
+    def _run(self):
+        period = 1.0 / self.sample_hz
+        next_sample = time.monotonic()
+
+        while not self._stop.is_set():
+            self.sample_once(time.time())
+
+            # Fixed-rate schedule; skip missed ticks instead of bursting
+            next_sample += period
+            delay = next_sample - time.monotonic()
+            if delay < 0:
+                next_sample = time.monotonic()
+                delay = 0
+            self._stop.wait(delay)
+
+    def _close_window(self, start, end):
+        with self._buffer_lock:
+            times, values = self.buffer.between(start, end)
+        window = aggregate_window(start, end, times, values)
+        with self._ready:
+            self._windows.append(window)
+            self._ready.notify_all()
+
+    def shrink(self):
+        """
+        Memory-budget hook: keep only one window of samples (plus a small margin)
+        and only the newest pending window.
+        """
+        capacity = max(2, math.ceil(self.window_seconds * self.sample_hz * 1.1))
+        with self._buffer_lock:
+            if capacity < self.buffer.capacity:
+                self.buffer.resize(capacity)
+        with self._ready:
+            self._windows = collections.deque(self._windows, maxlen=1)
+
+    def next_window(self, timeout=None):
+        """Block until a window is complete and return it (None on timeout)."""
+        with self._ready:
+            if not self._ready.wait_for(lambda: self._windows, timeout=timeout):
+                return None
+            return self._windows.popleft()
+
+    def latest_sample(self):
+        """Most recent raw sample as a dict, or None before the first read."""
+        with self._buffer_lock:
+            latest = self.buffer.latest()
+        if latest is None:
+            return None
+        return dict(zip(CHANNELS, (round(float(v), 2) for v in latest[1])))
@@ -0,0 +1,115 @@
+import random
+import socket
+import struct
+
+# Channels every driver returns (irradiation in W/m²)
+CHANNELS = ["irradiation", "ambient_temp", "module_temp", "wind_speed"]
+
+# Plausible ranges used by the simulator
+CHANNEL_RANGES = {
+    "irradiation": (200.0, 1000.0),
+    "ambient_temp": (20.0, 40.0),
+    "module_temp": (25.0, 55.0),
+    "wind_speed": (0.0, 10.0)
+}
+
+# Modbus input register layout: register i holds CHANNELS[i] * scale as uint16
+REGISTER_SCALES = {
+    "irradiation": 10,
+    "ambient_temp": 100,
+    "module_temp": 100,
+    "wind_speed": 100
+}
+
+class SensorDriver:
+    """
+    Base class for sensor sources.
+    read() returns one sample as a list of floats in CHANNELS order.
+    """
+
+    def read(self):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class SimulatedDriver(SensorDriver):
+    """
+    Simulated Raspberry Pi sensor readings.
+    Each channel does a bounded random walk so consecutive 1 Hz samples look like a real signal.
+    """
+
+    def __init__(self, step_fraction=0.01, seed=None):
+        self._random = random.Random(seed)
+        self._step_fraction = step_fraction
+        self._state = [self._random.uniform(*CHANNEL_RANGES[name]) for name in CHANNELS]
+
+    def read(self):
+        for i, name in enumerate(CHANNELS):
+            low, high = CHANNEL_RANGES[name]
+            step = (high - low) * self._step_fraction
+            self._state[i] = min(high, max(low, self._state[i] + self._random.uniform(-step, step)))
+        return [round(value, 2) for value in self._state]
+
+class ModbusTCPDriver(SensorDriver):
+    """
+    Reads CHANNELS from Modbus-TCP input registers (function 0x04), starting at register 0.
+    Works against a real data logger or the local simulator in sensors/modbus_simulator.py.
+    """
+
+    def __init__(self, host="127.0.0.1", port=5020, unit_id=1, timeout=2.0):
+        self.host = host
+        self.port = port
+        self.unit_id = unit_id
+        self.timeout = timeout
+        self._sock = None
+        self._transaction = 0
+
+    def _connect(self):
+        if self._sock is None:
+            self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        return self._sock
+
+    def _recv_exact(self, size):
+        data = b""
+        while len(data) < size:
+            chunk = self._sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("Modbus connection closed")
+            data += chunk
+        return data
+
+    def read_input_registers(self, address, count):
+        self._transaction = (self._transaction + 1) % 0x10000
+        request = struct.pack(">HHHBBHH", self._transaction, 0, 6, self.unit_id, 0x04, address, count)
+
+        try:
+            sock = self._connect()
+            sock.sendall(request)
+            _, _, length, _ = struct.unpack(">HHHB", self._recv_exact(7))
+            pdu = self._recv_exact(length - 1)
+        except OSError:
+            # Reconnect on the next read
+            self.close()
+            raise
+
+        if pdu[0] & 0x80:
+            raise IOError(f"Modbus exception code {pdu[1]}")
+        return list(struct.unpack(f">{pdu[1] // 2}H", pdu[2:2 + pdu[1]]))
+
+    def read(self):
+        registers = self.read_input_registers(0, len(CHANNELS))
+        return [register / REGISTER_SCALES[name] for name, register in zip(CHANNELS, registers)]
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+def make_driver(name, **kwargs):
+    """Build a driver by name ("simulated" or "modbus")."""
+    if name == "simulated":
+        return SimulatedDriver(**kwargs)
+    if name == "modbus":
+        return ModbusTCPDriver(**kwargs)
+    raise ValueError(f"Unknown sensor driver: {name}")
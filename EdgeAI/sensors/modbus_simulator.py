@@ -0,0 +1,92 @@
+"""
+Local Modbus-TCP sensor simulator.
+Serves SimulatedDriver readings as input registers (function 0x04) so the
+ModbusTCPDriver can be exercised without hardware:
+
+    python -m sensors.modbus_simulator --port 5020
+"""
+import argparse
+import socketserver
+import struct
+import threading
+
+from sensors.drivers import CHANNELS, REGISTER_SCALES, SimulatedDriver
+
+class _ModbusHandler(socketserver.BaseRequestHandler):
+
+    def _recv_exact(self, size):
+        data = b""
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def handle(self):
+        while True:
+            header = self._recv_exact(7)
+            if header is None:
+                return
+            transaction, protocol, length, unit_id = struct.unpack(">HHHB", header)
+            pdu = self._recv_exact(length - 1)
+            if pdu is None:
+                return
+
+            response = self.server.respond(pdu)
+            self.request.sendall(struct.pack(">HHHB", transaction, protocol, len(response) + 1, unit_id) + response)
+
+class ModbusSimulator(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=5020, driver=None):
+        super().__init__((host, port), _ModbusHandler)
+        self.driver = driver or SimulatedDriver()
+        self._lock = threading.Lock()
+
+    def registers(self):
+        with self._lock:
+            sample = self.driver.read()
+        return [
+            max(0, min(0xFFFF, int(round(value * REGISTER_SCALES[name]))))
+            for name, value in zip(CHANNELS, sample)
+        ]
+
+    def respond(self, pdu):
+        if len(pdu) == 0:
+            return struct.pack(">BB", 0x80, 0x03)  # Illegal data value
+        function = pdu[0]
+        if function != 0x04:
+            return struct.pack(">BB", function | 0x80, 0x01)  # Illegal function
+        if len(pdu) < 5:
+            return struct.pack(">BB", function | 0x80, 0x03)
+
+        address, count = struct.unpack(">HH", pdu[1:5])
+        if count == 0:
+            return struct.pack(">BB", function | 0x80, 0x03)
+        registers = self.registers()
+        if address + count > len(registers):
+            return struct.pack(">BB", function | 0x80, 0x02)  # Illegal data address
+
+        values = registers[address:address + count]
+        return struct.pack(f">BB{count}H", function, count * 2, *values)
+
+    def start(self):
+        """Serve in a background thread (for tests and local runs)."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Modbus-TCP sensor simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    args = parser.parse_args()
+
+    server = ModbusSimulator(args.host, args.port)
+    print(f"Modbus simulator listening on {args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nModbus simulator stopped")
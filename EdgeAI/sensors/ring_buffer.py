@@ -0,0 +1,56 @@
+import numpy as np
+
+class RingBuffer:
+    """
+    Fixed-size buffer of timestamped multi-channel samples.
+    Storage is preallocated once; pushing past capacity overwrites the oldest sample,
+    so memory stays constant no matter how long the process runs.
+    """
+
+    def __init__(self, capacity, n_channels):
+        self.capacity = int(capacity)
+        self.times = np.zeros(self.capacity)
+        self.values = np.zeros((self.capacity, n_channels))
+        self._next = 0     # Slot the next sample goes into
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def push(self, timestamp, values):
+        self.times[self._next] = timestamp
+        self.values[self._next] = values
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _ordered_slots(self):
+        """Slot indices from oldest to newest."""
+        start = (self._next - self._count) % self.capacity
+        return (start + np.arange(self._count)) % self.capacity
+
+    def between(self, start, end):
+        """(times, values) copies of the samples with start <= timestamp < end, oldest first."""
+        slots = self._ordered_slots()
+        times = self.times[slots]
+        mask = (times >= start) & (times < end)
+        return times[mask], self.values[slots[mask]]
+
+    def resize(self, capacity):
+        """Reallocate to a new capacity, keeping the newest samples that fit."""
+        slots = self._ordered_slots()[-int(capacity):]
+        times, values = self.times[slots], self.values[slots]
+
+        self.capacity = int(capacity)
+        self.times = np.zeros(self.capacity)
+        self.values = np.zeros((self.capacity, values.shape[1]))
+        self.times[:len(slots)] = times
+        self.values[:len(slots)] = values
+        self._count = len(slots)
+        self._next = self._count % self.capacity
+
+    def latest(self):
+        """Most recent (timestamp, values), or None if empty."""
+        if self._count == 0:
+            return None
+        slot = (self._next - 1) % self.capacity
+        return self.times[slot], self.values[slot].copy()
@@ -0,0 +1,153 @@
+"""
+Accelerated soak test for the edge runner.
+
+Replays `--hours` of simulated time (1 Hz sensor samples, 15-minute windows,
+hourly forecast updates) as fast as the CPU allows and records RSS once per
+simulated hour. Samples go through Acquisition.sample_once (ring buffer and
+window deque) and windows through edge_runner.build_summary, on a simulated
+clock; only the sampler thread's sleep loop is not exercised. Passes when RSS
+growth after warm-up stays under `--max-growth-mb` and at least one vision
+call actually ran YOLO (classify_panel falls back to "Clean" on errors, which
+would leave the model and torch out of the measurement).
+
+    python soak_test.py --hours 24
+    python soak_test.py --hours 24 --memory-budget 300 --trace-memory
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import sys
+import time
+
+import edge_runner
+from memory_monitor import MemoryMonitor
+from scheduler import AdaptiveScheduler, POLICIES, DEFAULT_POLICY
+from sensors.acquisition import Acquisition, WINDOW_SECONDS
+from sensors.drivers import CHANNELS, SensorDriver, SimulatedDriver
+from inference import classify_dust
+
+def day_factor(sim_time):
+    """0 at night, 1 at solar noon, so the replay goes through night and low-light modes."""
+    hour = time.localtime(sim_time).tm_hour + time.localtime(sim_time).tm_min / 60
+    return max(0.0, math.sin(math.pi * (hour - 6) / 12))
+
+class DaylightDriver(SensorDriver):
+    """Simulated driver whose irradiance follows the day curve of the simulated clock."""
+
+    def __init__(self):
+        self._driver = SimulatedDriver(seed=1)
+        self._irradiation = CHANNELS.index("irradiation")
+        self.sim_time = 0.0
+
+    def read(self):
+        sample = self._driver.read()
+        sample[self._irradiation] *= day_factor(self.sim_time)
+        return sample
+
+def synthetic_hourly(sim_time):
+    """open-meteo shaped hourly arrays for the 24 hours from sim_time."""
+    hours = [sim_time + h * 3600 for h in range(24)]
+    return {
+        "time": [time.strftime("%Y-%m-%dT%H:00", time.localtime(t)) for t in hours],
+        "temperature_2m": [25 + 8 * day_factor(t) for t in hours],
+        "wind_speed_10m": [3.0] * 24,
+        "cloud_cover": [20.0] * 24,
+        "shortwave_radiation": [900 * day_factor(t) for t in hours]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Accelerated memory soak test for the edge runner")
+    parser.add_argument("--hours", type=float, default=24.0, help="Simulated hours to run")
+    parser.add_argument("--sample-hz", type=float, default=1.0)
+    parser.add_argument("--window", type=float, default=WINDOW_SECONDS)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default=DEFAULT_POLICY)
+    parser.add_argument("--memory-budget", type=float, help="RSS budget in MB to enforce during the run")
+    parser.add_argument("--trace-memory", action="store_true", help="Record tracemalloc top-N sites")
+    parser.add_argument("--warmup-hours", type=float, default=2.0, help="Hours excluded from the growth check")
+    parser.add_argument("--max-growth-mb", type=float, default=5.0, help="Allowed RSS growth after warm-up")
+    parser.add_argument("--post", action="store_true", help="POST summaries to the local API as the runner does")
+    parser.add_argument("--verbose", action="store_true", help="Show the runner's per-window output")
+    args = parser.parse_args()
+
+    driver = DaylightDriver()
+    acquisition = Acquisition(driver, sample_hz=args.sample_hz, window_seconds=args.window)
+    scheduler = AdaptiveScheduler(args.policy, cpu_probe=None, temp_probe=None)
+
+    monitor = MemoryMonitor(budget_mb=args.memory_budget, interval=None, trace=args.trace_memory, log=False)
+    edge_runner.register_shrinkers(monitor, acquisition)
+    if args.trace_memory:
+        monitor.start_tracing()
+
+    try:
+        run_soak(args, driver, acquisition, scheduler, monitor)
+    finally:
+        monitor.stop()
+
+def run_soak(args, driver, acquisition, scheduler, monitor):
+    sim_start = math.floor(time.time() / 3600) * 3600
+    total_samples = int(args.hours * 3600 * args.sample_hz)
+    step = 1.0 / args.sample_hz
+    next_hour = sim_start
+    summaries = 0
+    series = []
+    started = time.perf_counter()
+
+    with open(os.devnull, "w") as devnull:
+        quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(devnull)
+        with quiet:
+            for i in range(total_samples + 1):
+                sim_time = sim_start + i * step
+
+                if sim_time >= next_hour:
+                    # New forecast every simulated hour, memory snapshot alongside
+                    edge_runner.forecast_engine.update({"plant_1": synthetic_hourly(sim_time)})
+                    entry = monitor.snapshot()
+                    series.append(((sim_time - sim_start) / 3600, entry["rss_mb"], entry["shrunk"]))
+                    next_hour += 3600
+
+                driver.sim_time = sim_time
+                acquisition.sample_once(sim_time)
+
+                window = acquisition.next_window(timeout=0)
+                while window is not None:
+                    summary = edge_runner.build_summary(window, scheduler)
+                    if summary is not None:
+                        summaries += 1
+                        if args.post:
+                            edge_runner.requests.post(edge_runner.API_URL, json=summary, timeout=10)
+                        else:
+                            json.dumps(summary)  # Same serialization work as the POST
+                    window = acquisition.next_window(timeout=0)
+
+    elapsed = time.perf_counter() - started
+    print(f"Simulated {args.hours:.0f} h in {elapsed:.1f} s ({args.hours * 3600 / elapsed:.0f}x), {summaries} summaries")
+    print(f"{'hour':>5} {'rss MB':>8}")
+    for hour, rss, shrunk in series:
+        note = f"  shrunk: {', '.join(shrunk)}" if shrunk else ""
+        print(f"{hour:5.0f} {rss:8.1f}{note}")
+
+    if args.trace_memory and monitor.history:
+        print("\nTop allocation sites at the end of the run:")
+        for stat in monitor.history[-1].get("top", []):
+            print(f"  {stat['size_kb']:>9} kB  {stat['where']}")
+
+    vision_runs, vision_errors = classify_dust.stats["runs"], classify_dust.stats["errors"]
+    print(f"\nVision: {vision_runs} runs, {vision_errors} errors")
+    if vision_runs == 0 or vision_errors == vision_runs:
+        print("FAIL: vision never ran successfully (ultralytics or model/best1.pt missing?), so YOLO is not covered")
+        sys.exit(1)
+
+    after_warmup = [rss for hour, rss, _ in series if hour >= args.warmup_hours and rss is not None]
+    if len(after_warmup) < 2:
+        print("\nNot enough samples after warm-up to judge memory growth")
+        return
+    growth = after_warmup[-1] - min(after_warmup)
+    verdict = "PASS" if growth <= args.max_growth_mb else "FAIL"
+    print(f"\n{verdict}: RSS grew {growth:.1f} MB after warm-up (limit {args.max_growth_mb} MB)")
+    if verdict == "FAIL":
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 import requests
 
+WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Hourly variables needed by the forecast engine
+FORECAST_HOURLY = "cloud_cover,temperature_2m,wind_speed_10m,shortwave_radiation"
+
 def get_weather():
-    url = "https://api.open-meteo.com/v1/forecast"
     params = {
         "latitude": 12.9,
         "longitude": 79.1,
@@ -9,8 +13,32 @@ def get_weather():
         "forecast_days": 1
     }
 
-    r = requests.get(url, params=params, timeout=10)
+    r = requests.get(WEATHER_URL, params=params, timeout=10)
     data = r.json()
 
     rain_sum = sum(data["hourly"]["precipitation"])
     return rain_sum > 1, round(rain_sum, 2)
+
+def get_hourly_forecast(sites, forecast_days=1):
+    """
+    Fetch open-meteo hourly forecasts for several sites in one request.
+    sites: list of {"site_id": str, "latitude": float, "longitude": float}
+    Returns {site_id: hourly_dict} where hourly_dict holds the raw open-meteo arrays.
+    """
+    params = {
+        "latitude": ",".join(str(site["latitude"]) for site in sites),
+        "longitude": ",".join(str(site["longitude"]) for site in sites),
+        "hourly": FORECAST_HOURLY,
+        "wind_speed_unit": "ms",
+        "forecast_days": forecast_days,
+        "timezone": "auto"
+    }
+
+    r = requests.get(WEATHER_URL, params=params, timeout=10)
+    data = r.json()
+
+    # open-meteo returns a list for multiple locations, a single object otherwise
+    if isinstance(data, dict):
+        data = [data]
+
+    return {site["site_id"]: entry["hourly"] for site, entry in zip(sites, data)}
@@ -0,0 +1,330 @@
+"""
+Fleet load generator for the summary API.
+
+Simulates N edge devices posting summaries (optionally with a panel image) and
+M dashboards polling GET /api/summary, and reports latency percentiles, error
+rate and server RSS over time.
+
+    python loadgen.py --spawn --devices 50 --interval 5 --duration 60
+    python loadgen.py --spawn --find-saturation --p99-limit 250
+    python loadgen.py --url http://127.0.0.1:5000 --server-pid 1234 --devices 200
+
+Requires aiohttp; psutil is used for RSS when installed (falls back to /proc).
+"""
+import argparse
+import asyncio
+import base64
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+import aiohttp
+
+BASE_DIR = os.path.dirname(__file__)
+IMAGE_PATH = os.path.join(BASE_DIR, "..", "EdgeAI", "images", "clean1.jpeg")
+VISION_LABELS = ["Clean", "Clean", "Clean", "Dust", "BirdDroppings", "ElectricalDamage"]
+
+# ------------------------
+# PAYLOADS
+# ------------------------
+def load_image():
+    with open(IMAGE_PATH, "rb") as img_file:
+        return base64.b64encode(img_file.read()).decode("utf-8")
+
+def make_summary(device_id, image_data=None):
+    """Summary shaped like the one edge_runner posts."""
+    vision_label = random.choice(VISION_LABELS)
+    avg_loss_percent = round(random.uniform(0.5, 25), 2)
+    now = datetime.now()
+    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    summary = {
+        "device_id": device_id,
+        "date": now.strftime("%Y-%m-%d %H:%M:%S"),
+        "expected_power": round(random.uniform(200, 600), 2),
+        "avg_loss_percent": avg_loss_percent,
+        "vision_label": vision_label,
+        "dust_detected": vision_label == "Dust",
+        "health_score": round(100 - avg_loss_percent, 2),
+        "forecasted_energy_kWh": round(random.uniform(3, 5), 2),
+        "energy_forecast": [
+            {"time": (start_of_day + timedelta(hours=h)).strftime("%Y-%m-%dT%H:%M"),
+             "energy_kWh": round(random.uniform(0, 0.6), 3)}
+            for h in range(24)
+        ],
+        "sensor_window": {
+            "samples": 900,
+            "min": {"irradiation": 400.0, "ambient_temp": 28.0, "module_temp": 35.0, "wind_speed": 1.0},
+            "max": {"irradiation": 900.0, "ambient_temp": 34.0, "module_temp": 50.0, "wind_speed": 5.0}
+        }
+    }
+    if image_data is not None:
+        summary["panel_image"] = image_data
+    return summary
+
+# ------------------------
+# SERVER PROCESS
+# ------------------------
+def spawn_server(port):
+    """Start api/server.py without the debug reloader so the PID is the serving process."""
+    code = f"import server; server.app.run(host='127.0.0.1', port={port}, debug=False, threaded=True)"
+    process = subprocess.Popen(
+        [sys.executable, "-c", code],
+        cwd=BASE_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    return process
+
+def server_rss_mb(pid):
+    """Resident set size of the server process in MB, or None if unknown."""
+    if pid is None:
+        return None
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss / 1e6
+    except ImportError:
+        pass
+    except Exception:
+        return None
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1e3
+    except OSError:
+        return None
+    return None
+
+async def wait_for_server(url, timeout=15):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(url + "/") as response:
+                    if response.status == 200:
+                        return True
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.2)
+    return False
+
+# ------------------------
+# METRICS
+# ------------------------
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+class Stats:
+    """Latencies and errors collected since the last reset, also forwarded to `parent`."""
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.reset()
+
+    def reset(self):
+        self.latencies = []
+        self.errors = 0
+
+    def record(self, latency, ok):
+        self.latencies.append(latency)
+        if not ok:
+            self.errors += 1
+        if self.parent is not None:
+            self.parent.record(latency, ok)
+
+    def snapshot(self, elapsed):
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            "requests": count,
+            "rps": count / elapsed if elapsed > 0 else 0.0,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "error_rate": self.errors / count if count else 0.0
+        }
+
+# ------------------------
+# CLIENTS
+# ------------------------
+async def _timed_request(session, stats, method, url, **kwargs):
+    start = time.perf_counter()
+    ok = False
+    try:
+        async with session.request(method, url, **kwargs) as response:
+            await response.read()
+            ok = response.status == 200
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        pass
+    stats.record(time.perf_counter() - start, ok)
+
+async def edge_device(session, url, stats, device_id, interval, jitter, image_data, stop):
+    # Spread devices over the first interval instead of starting in lockstep
+    await asyncio.sleep(random.uniform(0, interval))
+    while not stop.is_set():
+        started = time.monotonic()
+        await _timed_request(session, stats, "POST", url + "/api/summary", json=make_summary(device_id, image_data))
+        delay = interval * (1 + random.uniform(-jitter, jitter)) - (time.monotonic() - started)
+        await asyncio.sleep(max(0.0, delay))
+
+async def dashboard_reader(session, url, stats, interval, stop):
+    await asyncio.sleep(random.uniform(0, interval))
+    while not stop.is_set():
+        started = time.monotonic()
+        await _timed_request(session, stats, "GET", url + "/api/summary")
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+# ------------------------
+# RUNS
+# ------------------------
+def print_header():
+    print(f"{'time':>6} {'devices':>7} {'req':>6} {'rps':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'err %':>6} {'rss MB':>7}")
+
+def print_row(elapsed, devices, snap, rss):
+    rss_text = f"{rss:7.1f}" if rss is not None else f"{'n/a':>7}"
+    print(
+        f"{elapsed:6.0f} {devices:7d} {snap['requests']:6d} {snap['rps']:7.1f} "
+        f"{snap['p50_ms']:8.1f} {snap['p95_ms']:8.1f} {snap['p99_ms']:8.1f} "
+        f"{snap['error_rate'] * 100:6.2f} {rss_text}"
+    )
+
+async def run_load(args, devices, duration, server_pid):
+    """Run one load level for `duration` seconds; returns the overall snapshot."""
+    total_stats = Stats()
+    window_stats = Stats(parent=total_stats)
+
+    image_data = load_image() if args.images else None
+    stop = asyncio.Event()
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    connector = aiohttp.TCPConnector(limit=0)
+
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        stats = window_stats
+        tasks = [
+            asyncio.create_task(edge_device(
+                session, args.url, stats, f"edge-{i}", args.interval, args.jitter,
+                image_data if random.random() < args.image_ratio else None, stop
+            ))
+            for i in range(devices)
+        ]
+        tasks += [
+            asyncio.create_task(dashboard_reader(session, args.url, stats, args.reader_interval, stop))
+            for _ in range(args.readers)
+        ]
+
+        started = last_report = time.monotonic()
+        while time.monotonic() - started < duration:
+            await asyncio.sleep(min(args.report_every, duration - (time.monotonic() - started)))
+            now = time.monotonic()
+            print_row(now - started, devices, window_stats.snapshot(now - last_report), server_rss_mb(server_pid))
+            window_stats.reset()
+            last_report = now
+
+        stop.set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return total_stats.snapshot(duration)
+
+def saturated(snap, args):
+    return snap["p99_ms"] > args.p99_limit or snap["error_rate"] > args.error_limit
+
+async def find_saturation(args, server_pid):
+    """
+    Double the fleet until p99 latency or error rate crosses the limit,
+    then bisect between the last good and first bad fleet size.
+    """
+    good, bad = 0, None
+    devices = args.devices
+    while bad is None and devices <= args.max_devices:
+        print(f"\n--- {devices} devices ---")
+        print_header()
+        snap = await run_load(args, devices, args.step_duration, server_pid)
+        if saturated(snap, args):
+            bad = devices
+        else:
+            good = devices
+            devices *= 2
+
+    if bad is None:
+        print(f"\nNo saturation up to {good} devices")
+        return good
+
+    while bad - good > max(1, good // 10):
+        devices = (good + bad) // 2
+        print(f"\n--- {devices} devices ---")
+        print_header()
+        snap = await run_load(args, devices, args.step_duration, server_pid)
+        if saturated(snap, args):
+            bad = devices
+        else:
+            good = devices
+
+    print(f"\nSaturation point: ~{good} devices sustained "
+          f"(p99 <= {args.p99_limit} ms, errors <= {args.error_limit * 100:.1f}%), {bad} did not")
+    return good
+
+async def main_async(args):
+    server = None
+    server_pid = args.server_pid
+    if args.spawn:
+        server = spawn_server(args.port)
+        server_pid = server.pid
+        args.url = f"http://127.0.0.1:{args.port}"
+        if not await wait_for_server(args.url):
+            server.terminate()
+            sys.exit("API server did not start")
+
+    try:
+        if args.find_saturation:
+            await find_saturation(args, server_pid)
+        else:
+            print_header()
+            snap = await run_load(args, args.devices, args.duration, server_pid)
+            print("\nTotal:")
+            print_row(args.duration, args.devices, snap, server_rss_mb(server_pid))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description="Fleet load generator for the summary API")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="API base URL")
+    parser.add_argument("--spawn", action="store_true", help="Start a local api/server.py instance")
+    parser.add_argument("--port", type=int, default=5055, help="Port for --spawn")
+    parser.add_argument("--server-pid", type=int, help="PID of an already running API for RSS tracking")
+    parser.add_argument("--devices", type=int, default=10, help="Simulated edge devices (start size for --find-saturation)")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between posts per device")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Relative jitter on the interval (0.2 = ±20%%)")
+    parser.add_argument("--images", action="store_true", help="Attach the base64 panel image to posts")
+    parser.add_argument("--image-ratio", type=float, default=1.0, help="Fraction of devices sending images with --images")
+    parser.add_argument("--readers", type=int, default=1, help="Simulated dashboards polling GET /api/summary")
+    parser.add_argument("--reader-interval", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to run (fixed-load mode)")
+    parser.add_argument("--report-every", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds")
+    parser.add_argument("--find-saturation", action="store_true", help="Ramp devices until limits are exceeded")
+    parser.add_argument("--step-duration", type=float, default=30.0, help="Seconds per step in --find-saturation")
+    parser.add_argument("--max-devices", type=int, default=10000)
+    parser.add_argument("--p99-limit", type=float, default=500.0, help="p99 latency limit in ms")
+    parser.add_argument("--error-limit", type=float, default=0.01, help="Error rate limit (0.01 = 1%%)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main_async(args))
+    except KeyboardInterrupt:
+        print("\nLoad generator stopped by user")
+
+if __name__ == "__main__":
+    main()